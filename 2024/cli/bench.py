@@ -0,0 +1,193 @@
+import os
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from importlib import import_module
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Any, Callable
+
+import typer
+from rich import box, print
+from rich.console import Console
+from rich.table import Column, Table
+from typing_extensions import Annotated
+
+from cli.utils.abstract_command import CommandBase
+from cli.utils.bench_results import BenchCurve, BenchPoint
+from cli.utils.day import Day
+from cli.utils.format_size import format_size
+from cli.utils.part import Part
+
+app = typer.Typer()
+
+PARSE_PHASE = "parse"
+
+
+class BenchCommand(CommandBase):
+    day: Day
+    scales: list[float]
+    seed: int
+    run_count: int
+    cut_off_time: float
+    memory: bool
+
+    def __init__(self, day: Day, scales: list[float], seed: int, run_count: int, cut_off_time: float, memory: bool):
+        super().__init__()
+        self.day = day
+        if not scales or any(scale <= 0 for scale in scales):
+            raise ValueError("scales must be positive")
+        self.scales = sorted(set(scales))
+        self.seed = seed
+        self.run_count = run_count
+        self.cut_off_time = cut_off_time
+        self.memory = memory
+
+    def run(self) -> None:
+        """Run each phase of the solution on generated inputs of increasing size."""
+        generate_input = self._get_input_generator()
+        solution_class = self.get_solution_class(self.day)
+        curves = {phase: BenchCurve(phase=phase, points=[]) for phase in [PARSE_PHASE, *map(str, Part)]}
+        input_sizes = {}
+        with tempfile.TemporaryDirectory() as directory:
+            input_file_path = Path(directory) / "input.txt"
+            for scale in self.scales:
+                print(f"Benchmarking day {self.day} at scale {scale:g} ...")
+                input_file_path.write_text(generate_input(scale, seed=self.seed))
+                input_size = input_file_path.stat().st_size
+                input_sizes[scale] = input_size
+
+                def create_instance() -> Any:
+                    return solution_class(input_file_path)
+
+                self._bench_phase(curves[PARSE_PHASE], scale, input_size, create_instance)
+                for part in Part:
+                    # solutions may modify their parsed state, so each run gets a fresh instance
+                    self._bench_phase(
+                        curves[str(part)], scale, input_size, lambda p=part: create_instance().solve(p), create_instance
+                    )
+
+        self._export_results_to_console(list(curves.values()), input_sizes)
+
+    def _get_input_generator(self) -> Callable[..., str]:
+        """Return generate_input function of the day."""
+        package_name = self.get_solution_dir_path(self.day).name
+        try:
+            generator_module = import_module(f"{package_name}.generator")
+        except ModuleNotFoundError:
+            raise ValueError(f"no input generator for day {self.day}") from None
+        return getattr(generator_module, "generate_input")
+
+    def _bench_phase(
+        self,
+        curve: BenchCurve,
+        scale: float,
+        input_size: int,
+        func: Callable[[], Any],
+        setup: Callable[[], Any] | None = None,
+    ) -> None:
+        """Add the fastest run of func at this scale to the curve.
+
+        A phase that exceeded the cut-off time at a smaller scale is skipped. If setup is given, its run time
+        is subtracted from the run time of func.
+        """
+        if curve.points and curve.points[-1].time > self.cut_off_time:
+            return
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            setup_time = min(self._time_runs(setup)) if setup is not None else 0.0
+            time = max(min(self._time_runs(func)) - setup_time, 0.0)
+            peak_memory = self._measure_peak_memory(func) if self.memory else None
+        curve.points.append(BenchPoint(scale=scale, input_size=input_size, time=time, peak_memory=peak_memory))
+
+    def _time_runs(self, func: Callable[[], Any]) -> list[float]:
+        """Return timings of up to run_count runs of func, stopping early after cut_off_time seconds."""
+        times = []
+        for _ in range(self.run_count):
+            start = timer()
+            func()
+            times.append(timer() - start)
+            if sum(times) >= self.cut_off_time:
+                break
+        return times
+
+    @staticmethod
+    def _measure_peak_memory(func: Callable[[], Any]) -> int:
+        """Return peak memory traced by tracemalloc during a single run of func."""
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def _export_results_to_console(self, curves: list[BenchCurve], input_sizes: dict[float, int]) -> None:
+        """Print time and memory curves to console."""
+        scale_columns = [f"×{scale:g}\n{format_size(input_sizes[scale])}" for scale in self.scales]
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Part", style="cyan"),
+            *(Column(name, justify="right", style="yellow") for name in scale_columns),
+            Column("Fit", justify="right", style="red"),
+            title=f"Benchmark results for day {self.day}",
+            caption=f"fastest of {self.run_count} runs, n is the input size in bytes",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for curve in curves:
+            table.add_row(*curve.to_table_row(self.scales))
+        console.print(table)
+
+        if not self.memory:
+            return
+        console.print("")
+        memory_table = Table(
+            Column("Part", style="cyan"),
+            *(Column(name, justify="right", style="red") for name in scale_columns),
+            title=f"Peak memory for day {self.day}",
+            caption="parse memory is included in the peak of each part",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for curve in curves:
+            memory_table.add_row(*curve.to_memory_table_row(self.scales))
+        console.print(memory_table)
+
+
+def parse_scales(scales: str) -> list[float]:
+    """Parse comma separated scale factors such as '1,2,4,8'."""
+    try:
+        return [float(scale) for scale in scales.split(",")]
+    except ValueError:
+        raise ValueError(f"invalid scales '{scales}'") from None
+
+
+@app.command()
+def bench(
+    day: Annotated[int, typer.Argument(min=1, max=25)],
+    scales: Annotated[
+        str, typer.Option(help="comma separated input sizes relative to the real input, e.g. '1,2,4,8'")
+    ] = "1,2,4,8",
+    seed: Annotated[int, typer.Option(help="seed for the input generator")] = 0,
+    run_count: Annotated[int, typer.Option(min=1, help="number of runs per part and scale")] = 3,
+    cut_off_time: Annotated[
+        float, typer.Option(help="time in seconds after which a part is not run at larger scales")
+    ] = 30,
+    memory: Annotated[bool, typer.Option("--memory", help="also record peak memory at each scale")] = False,
+):
+    """Benchmark the solutions for the queried day on generated inputs of increasing size."""
+    try:
+        BenchCommand(
+            day=day,
+            scales=parse_scales(scales),
+            seed=seed,
+            run_count=run_count,
+            cut_off_time=cut_off_time,
+            memory=memory,
+        ).run()
+    except Exception as e:
+        print(f"failed to benchmark solution: {e}")
+        raise typer.Exit(1)
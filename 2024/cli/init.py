@@ -1,65 +1,169 @@
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 import requests
 import typer
-from requests.models import Response
-from rich import print
+from requests.adapters import HTTPAdapter
+from rich import box, print
+from rich.console import Console
+from rich.table import Column, Table
 from typing_extensions import Annotated
 
 from cli.utils.abstract_command import CommandBase
-from cli.utils.day import Day
+from cli.utils.day import Day, parse_day_range
+from cli.utils.input_mirror import InputMirror
 
 app = typer.Typer()
 
+INPUT_MIRROR_DIR = Path(".cache/inputs")
+# AoC asks automated tools to keep the load low, so only a few requests are made at the same time
+DEFAULT_CONCURRENCY = 4
+REQUEST_TIMEOUT = 30  # seconds
+USER_AGENT = "github.com/mariuswinger/advent-of-code"
 
-class InitCommand(CommandBase):
+
+class InitResult(NamedTuple):
     day: Day
-    solution_dir_path: Path
+    source: str
+    error: str | None = None
+
+    def to_table_row(self) -> tuple[str, str, str]:
+        """Return row for rich.Table."""
+        status = "[green]ok[/green]" if self.error is None else f"[red]failed: {self.error}[/red]"
+        return (str(self.day), self.source, status)
+
+
+class InitCommand(CommandBase):
+    days: list[Day]
+    concurrency: int
+    refresh: bool
+    input_mirror: InputMirror
+    session: requests.Session
 
-    def __init__(self, day: Day):
+    def __init__(self, days: list[Day], concurrency: int = DEFAULT_CONCURRENCY, refresh: bool = False):
         super().__init__()
-        self.day = day
-        self.solution_dir_path = self.get_solution_dir_path(self.day)
+        if not days:
+            raise ValueError("no days to initialize")
+        self.days = days
+        self.concurrency = concurrency
+        self.refresh = refresh
+        # the mirror can be shared between checkouts by pointing 'AOC_INPUT_MIRROR' to a common directory
+        self.input_mirror = InputMirror(Path(os.environ.get("AOC_INPUT_MIRROR", self.root_path / INPUT_MIRROR_DIR)))
+        self.session = self._create_session()
 
     def run(self) -> None:
-        """Initialize new directory for solving the queried day."""
-        print(f"initializing AoC-{self.year}, day {self.day} ...")
-        self._copy_template()
+        """Initialize new directories for solving the queried days."""
+        if len(self.days) == 1:
+            with self.session:
+                result = self._init_day(self.days[0])
+            if result.error is not None:
+                raise ValueError(result.error)
+            return
 
-        print(f"downloading input data for AoC-{self.year} day {self.day} ...")
-        response = self._post_request()
-        if response.status_code != 200:
-            raise ValueError(f"unexpected response code: {response.status_code}")
+        print(f"initializing AoC-{self.year}, {len(self.days)} days using {self.concurrency} connections ...")
+        with self.session, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(self._init_day, self.days))
+        self._export_results_to_console(results)
+        if any(result.error is not None for result in results):
+            raise ValueError("one or more days failed")
+
+    def _create_session(self) -> requests.Session:
+        """Return session that keeps one connection per worker alive between requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.cookies.set("session", self.session_token)
+        session.headers["User-Agent"] = USER_AGENT
+        return session
 
-        print(f"writing input data to '{self.solution_dir_path}' ...")
-        self._export_input_data(response.text)
+    def _init_day(self, day: Day) -> InitResult:
+        """Copy the template and write the input for a single day."""
+        print(f"initializing AoC-{self.year}, day {day} ...")
+        try:
+            self._copy_template(day)
+            input_data = None if self.refresh else self.input_mirror.get(self.year, day)
+            source = "mirror"
+            if input_data is None:
+                print(f"downloading input data for AoC-{self.year} day {day} ...")
+                input_data = self._get_input_data(day)
+                self.input_mirror.put(self.year, day, input_data)
+                source = "download"
+            print(f"writing input data to '{self.get_solution_dir_path(day)}' ...")
+            self._export_input_data(day, input_data)
+        except Exception as e:
+            return InitResult(day=day, source="-", error=str(e))
+        return InitResult(day=day, source=source)
 
-    def _copy_template(self) -> None:
-        """Copy template files to new directory."""
-        self.solution_dir_path.mkdir()
-        template_file = self.solution_dir_path.parent / "_template/solution.py"
-        shutil.copy(template_file, self.solution_dir_path / "solution.py")
+    def _copy_template(self, day: Day) -> None:
+        """Copy template files to the directory of the day, keeping an existing solution."""
+        solution_dir_path = self.get_solution_dir_path(day)
+        solution_dir_path.mkdir(exist_ok=True)
+        solution_file_path = solution_dir_path / "solution.py"
+        if solution_file_path.exists():
+            return
+        template_file = solution_dir_path.parent / "_template/solution.py"
+        shutil.copy(template_file, solution_file_path)
 
-    def _post_request(self) -> Response:
-        """Post request for getting input data."""
-        url = f"https://adventofcode.com/{self.year}/day/{self.day}/input"
-        return requests.get(url, cookies={"session": self.session_token})
+    def _get_input_data(self, day: Day) -> bytes:
+        """Download input data."""
+        url = f"{self.base_url}/{self.year}/day/{day}/input"
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            raise ValueError(f"unexpected response code: {response.status_code}")
+        return response.content
 
-    def _export_input_data(self, input_data: str) -> None:
+    def _export_input_data(self, day: Day, input_data: bytes) -> None:
         """Write input data to file."""
-        input_file_path = self.solution_dir_path / "input.txt"
-        with input_file_path.open("w") as file:
-            file.writelines(input_data)
+        input_file_path = self.get_solution_dir_path(day) / "input.txt"
+        with input_file_path.open("wb") as file:
+            file.write(input_data)
+
+    def _export_results_to_console(self, results: list[InitResult]) -> None:
+        """Print init results to console."""
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Day", justify="right", style="cyan"),
+            Column("Input", style="yellow"),
+            Column("Status"),
+            title=f"Initialized days for AoC-{self.year}",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for result in results:
+            table.add_row(*result.to_table_row())
+        console.print(table)
 
 
 @app.command()
 def init(
-    day: Annotated[int, typer.Argument(min=1, max=25)],
+    day: Annotated[int | None, typer.Argument(min=1, max=25)] = None,
+    days: Annotated[
+        str | None, typer.Option(help="initialize the given days concurrently, e.g. '1-25' or '1,3,5'")
+    ] = None,
+    concurrency: Annotated[
+        int, typer.Option(min=1, max=8, help="maximum number of simultaneous downloads")
+    ] = DEFAULT_CONCURRENCY,
+    refresh: Annotated[
+        bool, typer.Option("--refresh", help="download inputs even if they are in the local mirror")
+    ] = False,
 ):
     """Initialize new directory for solving the queried day."""
     try:
-        InitCommand(day).run()
+        if days is not None:
+            if day is not None:
+                raise ValueError("day cannot be given together with '--days'")
+            day_list = parse_day_range(days)
+        elif day is not None:
+            day_list = [day]
+        else:
+            raise ValueError("day is required unless '--days' is given")
+        InitCommand(days=day_list, concurrency=concurrency, refresh=refresh).run()
     except Exception as e:
         print(f"failed to init: {e}")
         raise typer.Exit(1)
@@ -1,5 +1,13 @@
+import os
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from importlib import import_module
 from pathlib import Path
 from timeit import default_timer as timer
+from typing import Any, Callable, NamedTuple
 
 import typer
 from rich import box, print
@@ -9,71 +17,363 @@ from typing_extensions import Annotated
 
 from cli.utils.abstract_command import CommandBase
 from cli.utils.day import Day
+from cli.utils.format_time import format_time
+from cli.utils.hotspots import HotspotResults
+from cli.utils.isolation import Isolation, time_in_forked_child
 from cli.utils.part import Part
-from cli.utils.profile_results import PartProfileResults, ProfileResults
+from cli.utils.profile_history import ProfileHistory, ProfileHistoryEntry, get_git_revision
+from cli.utils.profile_results import (
+    AllocationSite,
+    EnvironmentInfo,
+    InstrumentationResults,
+    MemoryResults,
+    PartProfileResults,
+    ProfileResults,
+    SectionResults,
+    TimingResults,
+)
+from cli.utils.profile_schedule import DayEstimate, ScheduledDay, schedule_days
+from cli.utils.regression import PhaseComparison, compare_timings
+from utilities import instrumentation
 from utilities.solution_abstract import SolutionAbstract
 
 app = typer.Typer()
 
+TOP_ALLOCATION_SITE_COUNT = 5
+HISTORY_FILE_NAME = "profiling_history.json"
+
+
+class RegressionError(Exception):
+    pass
+
 
 class ProfileCommand(CommandBase):
     day: Day
     run_count: int
+    warmup_count: int
     cut_off_time: float
     output_file_name: str
     force_rerun: bool
+    memory: bool
+    instrument: bool
+    hotspot_count: int | None
+    record_baseline: bool
+    compare: bool
+    regression_threshold: float
+    significance: float
+    isolation: Isolation
     solution_dir_path: Path
     solution_instance: SolutionAbstract
+    parsed_state_snapshot: bytes | None
 
-    def __init__(self, day: Day, run_count: int, cut_off_time: float, output_file_name: str, force_rerun: bool):
-        super().__init__()
+    def __init__(
+        self,
+        day: Day,
+        run_count: int,
+        cut_off_time: float,
+        output_file_name: str,
+        force_rerun: bool,
+        warmup_count: int = 1,
+        memory: bool = False,
+        instrument: bool = False,
+        hotspot_count: int | None = None,
+        record_baseline: bool = False,
+        compare: bool = False,
+        regression_threshold: float = 0.1,
+        significance: float = 0.05,
+        isolation: Isolation = Isolation.SNAPSHOT,
+        use_parse_cache: bool = False,
+    ):
+        super().__init__(use_parse_cache=use_parse_cache)
         self.day = day
         self.run_count = run_count
+        self.warmup_count = warmup_count
         self.cut_off_time = cut_off_time
         self.output_file_name = output_file_name
         self.force_rerun = force_rerun
+        self.memory = memory
+        self.instrument = instrument
+        self.hotspot_count = hotspot_count
+        if record_baseline and compare:
+            raise ValueError("'--baseline' and '--compare' cannot be used together")
+        self.record_baseline = record_baseline
+        self.compare = compare
+        self.regression_threshold = regression_threshold
+        self.significance = significance
+        self.isolation = isolation
         self.solution_dir_path = self.get_solution_dir_path(self.day)
         self.solution_instance = self.get_solution_instance(self.day, input_file_name="input.txt")
+        # solutions may modify their parsed state, so it is restored before each run unless isolation is disabled
+        self.parsed_state_snapshot = None if isolation == Isolation.NONE else self.solution_instance.take_snapshot()
 
     @property
     def output_file_path(self) -> Path:
         """Return path to output file."""
         return self.solution_dir_path / self.output_file_name
 
+    @property
+    def history_file_path(self) -> Path:
+        """Return path to file with the history of profiling results."""
+        return self.solution_dir_path / HISTORY_FILE_NAME
+
+    @property
+    def input_file_path(self) -> Path:
+        """Return path to input file."""
+        return self.solution_dir_path / "input.txt"
+
     def run(self) -> None:
         """Profile the solutions for the queried day."""
+        history = ProfileHistory.from_file(self.history_file_path)
+        baseline = history.get_latest_baseline()
+        if self.compare and baseline is None:
+            raise ValueError(f"no baseline recorded for day {self.day}, record one with '--baseline'")
+
         has_results = self.output_file_path.exists()
-        if not has_results or self.force_rerun:
-            print(f"Profiling solution for day {self.day}, part {Part.A} ...")
-            part_a_results = self._profile_solution(Part.A)
-
-            print(f"Profiling solution for day {self.day}, part {Part.B} ...")
-            part_b_results = self._profile_solution(Part.B)
-            results = ProfileResults(day=self.day, a=part_a_results, b=part_b_results)
-            self._export_results_to_file(results)
+        if not has_results or self.force_rerun or self.record_baseline or self.compare:
+            results = self.profile_and_save()
         else:
             print(f"Reading profiling results from '{self.output_file_path}' ...")
             results = ProfileResults.from_file(self.output_file_path)
 
         self._export_results_to_console(results)
+        self._export_instrumentation_to_console(results)
+        if self.hotspot_count is not None:
+            for part in Part:
+                print(f"Capturing hotspots for day {self.day}, part {part} ...")
+                self._profile_hotspots(part)
+        self.print_parse_cache_stats()
+
+        if self.compare and baseline is not None:
+            self._compare_to_baseline(baseline, results)
+
+    def profile_phases(self) -> ProfileResults:
+        """Profile import, parsing and both parts."""
+        print(f"Profiling import of solution for day {self.day} ...")
+        import_results = self._profile_import()
+
+        print(f"Profiling input parsing for day {self.day} ...")
+        parse_results = self._profile_parse()
+
+        print(f"Profiling solution for day {self.day}, part {Part.A} ...")
+        part_a_results = self._profile_solution(Part.A)
+
+        print(f"Profiling solution for day {self.day}, part {Part.B} ...")
+        part_b_results = self._profile_solution(Part.B)
+        return ProfileResults(
+            day=self.day,
+            a=part_a_results,
+            b=part_b_results,
+            import_results=import_results,
+            parse_results=parse_results,
+            environment=EnvironmentInfo.collect(),
+        )
+
+    def profile_and_save(self) -> ProfileResults:
+        """Profile all phases and write the results to the output and history files."""
+        # take the revision before writing any output, which would otherwise mark the checkout as dirty
+        revision = get_git_revision(self.root_path, excluded_patterns=(self.output_file_name, HISTORY_FILE_NAME))
+        results = self.profile_phases()
+        self._export_results_to_file(results)
+        self._export_results_to_history(ProfileHistory.from_file(self.history_file_path), results, revision)
+        return results
+
+    def get_hotspots_file_path(self, part: Part) -> Path:
+        """Return path to the speedscope file for the given part."""
+        return self.solution_dir_path / f"{Path(self.output_file_name).stem}_hotspots_part{part}.speedscope.json"
+
+    def _profile_import(self) -> TimingResults:
+        """Time importing the solution package.
+
+        Dependencies such as numpy stay imported between runs, so this only measures the day package itself.
+        """
+        package_name = self.solution_dir_path.name
+
+        def reimport() -> None:
+            self._unload_solution_modules()
+            import_module(f"{package_name}.solution")
+
+        times, warmup_count = self._time_runs(reimport)
+        return TimingResults(run_count=len(times), times=times, warmup_count=warmup_count)
+
+    def _profile_parse(self) -> TimingResults:
+        """Time reading and parsing the input, bypassing the parse cache."""
+        solution_class = self.get_solution_class(self.day)
+        times, warmup_count = self._time_runs(lambda: solution_class(self.input_file_path))
+        memory = self._measure_memory(lambda: solution_class(self.input_file_path)) if self.memory else None
+        return TimingResults(run_count=len(times), times=times, warmup_count=warmup_count, memory=memory)
 
     def _profile_solution(self, part: Part) -> PartProfileResults:
         """Run solution to get profile timings."""
-        times = []
-        for i in range(self.run_count):
+        times, warmup_count = self._time_runs(lambda: self.solution_instance.solve(part), is_solve=True)
+        memory = None
+        if self.memory:
+            self._restore_parsed_state()
+            memory = self._measure_memory(lambda: self.solution_instance.solve(part))
+        return PartProfileResults(
+            part=part,
+            run_count=len(times),
+            times=times,
+            warmup_count=warmup_count,
+            memory=memory,
+            instrumentation=self._measure_instrumentation(part) if self.instrument else None,
+        )
+
+    def _measure_instrumentation(self, part: Part) -> InstrumentationResults:
+        """Run the part once with hot path instrumentation and collect its sections and counters.
+
+        Hot paths are only instrumented when defined with instrumentation enabled, so the solution package
+        is imported anew for this run and unloaded again afterwards. The timed runs keep using the
+        uninstrumented solution instance.
+        """
+        self._unload_solution_modules()
+        instrumentation.enable()
+        try:
+            solution_instance = self.get_solution_instance(self.day, input_file_name="input.txt")
+            with instrumentation.collect() as recorder:
+                start = timer()
+                solution_instance.solve(part)
+                run_time = timer() - start
+        finally:
+            instrumentation.disable()
+            self._unload_solution_modules()
+        return InstrumentationResults(
+            run_time=run_time,
+            sections=[
+                SectionResults(name=name, call_count=stats.call_count, time=stats.time)
+                for name, stats in recorder.sections.items()
+            ],
+            counters=dict(recorder.counters),
+        )
+
+    def _unload_solution_modules(self) -> None:
+        """Remove the solution package from the imported modules, so that the next import runs it again."""
+        package_name = self.solution_dir_path.name
+        for module_name in [m for m in sys.modules if m == package_name or m.startswith(f"{package_name}.")]:
+            del sys.modules[module_name]
+
+    def _profile_hotspots(self, part: Part) -> None:
+        """Run the part once under cProfile, print the top functions and write a speedscope file."""
+        if self.hotspot_count is None:
+            raise ValueError("hotspot count is not set")
+        self._restore_parsed_state()
+        hotspots = HotspotResults.capture(lambda: self.solution_instance.solve(part), root_path=self.root_path)
+
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Function", style="cyan"),
+            Column("Calls", justify="right", style="cyan"),
+            Column("Self", justify="right", style="yellow"),
+            Column("Cumulative", justify="right", style="red"),
+            title=f"Hotspots for day {self.day}, part {part}",
+            caption=f"total time under cProfile: {TimingResults.format_time(hotspots.total_time)}",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for row in hotspots.to_table_rows(self.hotspot_count):
+            table.add_row(*row)
+        console.print(table)
+
+        hotspots_file_path = self.get_hotspots_file_path(part)
+        print(f"writing speedscope profile to '{hotspots_file_path}' ...")
+        with hotspots_file_path.open("w") as file:
+            file.write(hotspots.to_speedscope_json(name=f"AoC-{self.year}, day {self.day}, part {part}"))
+
+    def _measure_memory(self, func: Callable[[], Any]) -> MemoryResults:
+        """Run func once under tracemalloc.
+
+        This is a separate run from the timed ones since tracing slows down allocations considerably.
+        """
+        tracemalloc.start()
+        try:
+            snapshot_before = tracemalloc.take_snapshot()
+            size_before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = func()
+            size_after, peak = tracemalloc.get_traced_memory()
+            snapshot_after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        # result is kept alive until here so that its allocations count as net allocations
+        del result
+
+        trace_filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+        statistics = snapshot_after.filter_traces(trace_filters).compare_to(
+            snapshot_before.filter_traces(trace_filters), "lineno"
+        )
+        top_sites = [
+            AllocationSite(location=self._format_frame(stat.traceback[0]), size=stat.size_diff, count=stat.count_diff)
+            for stat in statistics[:TOP_ALLOCATION_SITE_COUNT]
+        ]
+        return MemoryResults(
+            peak=peak - size_before, net=size_after - size_before, max_rss=_get_max_rss(), top_sites=top_sites
+        )
+
+    def _format_frame(self, frame: tracemalloc.Frame) -> str:
+        """Return frame location with path relative to the root path if possible."""
+        file_path = Path(frame.filename)
+        if file_path.is_relative_to(self.root_path):
+            file_path = file_path.relative_to(self.root_path)
+        return f"{file_path}:{frame.lineno}"
+
+    def _restore_parsed_state(self) -> None:
+        """Undo changes made to the parsed state by earlier runs."""
+        if self.parsed_state_snapshot is not None:
+            self.solution_instance.restore_snapshot(self.parsed_state_snapshot)
+
+    def _time_runs(self, func: Callable[[], Any], is_solve: bool = False) -> tuple[list[float], int]:
+        """Run func up to warmup_count times untimed, then return timings of up to run_count runs and warmup count.
+
+        Warmup runs count against cut_off_time. A warmup run that reaches it on its own is kept as the only
+        timing, so slow phases are not run a second time. If is_solve is set, each run starts from the parsed
+        state, either restored from the snapshot before the run or by running in a forked child that leaves
+        the parsed state untouched.
+        """
+        warmup_time = 0.0
+        for warmup_index in range(self.warmup_count):
+            if is_solve:
+                self._restore_parsed_state()
             start = timer()
-            self.solution_instance.solve(part)
-            end = timer()
-            times.append(end - start)
+            func()
+            run_time = timer() - start
+            if run_time >= self.cut_off_time:
+                self._print_cut_off_message(run_time)
+                return [run_time], warmup_index
+            warmup_time += run_time
+        if is_solve and self.isolation == Isolation.FORK:
+            # warmup runs happen in this process, forked runs only need the parsed state restored once after them
+            self._restore_parsed_state()
 
-            total_elapsed_time = sum(times)
+        times = []
+        for _ in range(self.run_count):
+            if is_solve and self.isolation == Isolation.SNAPSHOT:
+                self._restore_parsed_state()
+            if is_solve and self.isolation == Isolation.FORK:
+                times.append(time_in_forked_child(func))
+            else:
+                start = timer()
+                func()
+                end = timer()
+                times.append(end - start)
+
+            total_elapsed_time = warmup_time + sum(times)
             if total_elapsed_time >= self.cut_off_time:
-                print(
-                    f"Stopping profiling due to elapsed time ({total_elapsed_time:.2f}) being larger than allocated total time.\n"
-                    f"Currently {self.cut_off_time} seconds are allocated. This can be adjusted by setting '--cut-off-time'.\n"
-                )
-                return PartProfileResults(part=part, run_count=i + 1, times=times)
-        return PartProfileResults(part=part, run_count=self.run_count, times=times)
+                self._print_cut_off_message(total_elapsed_time)
+                break
+        return times, self.warmup_count
+
+    def _print_cut_off_message(self, total_elapsed_time: float) -> None:
+        """Print that profiling stopped early because of the cut-off time."""
+        print(
+            f"Stopping profiling due to elapsed time ({total_elapsed_time:.2f}) being larger than allocated total time.\n"
+            f"Currently {self.cut_off_time} seconds are allocated. This can be adjusted by setting '--cut-off-time'.\n"
+        )
 
     def _export_results_to_file(self, results: ProfileResults) -> None:
         """Write profile results to file."""
@@ -82,30 +382,267 @@ class ProfileCommand(CommandBase):
         with self.output_file_path.open("w") as file:
             file.write(results.to_json())
 
+    def _export_results_to_history(self, history: ProfileHistory, results: ProfileResults, revision: str) -> None:
+        """Append profile results to the history file."""
+        entry = ProfileHistoryEntry.create(results, revision=revision, is_baseline=self.record_baseline)
+        history = history.add_entry(entry)
+        label = "baseline" if entry.is_baseline else "results"
+        print(f"recording {label} for revision {entry.revision} in '{self.history_file_path}' ...")
+        history.to_file(self.history_file_path)
+
+    def _compare_to_baseline(self, baseline: ProfileHistoryEntry, results: ProfileResults) -> None:
+        """Compare results against the baseline and raise RegressionError if any phase regressed."""
+        baseline_phases = baseline.results.get_phases()
+        comparisons: list[PhaseComparison] = []
+        for name, timing_results in results.get_phases().items():
+            if name not in baseline_phases:
+                continue
+            comparisons.append(
+                compare_timings(
+                    name=name,
+                    baseline=baseline_phases[name],
+                    current=timing_results,
+                    threshold=self.regression_threshold,
+                    significance=self.significance,
+                )
+            )
+
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Part", style="cyan"),
+            Column("Baseline", justify="right", style="yellow"),
+            Column("Current", justify="right", style="yellow"),
+            Column("Change", justify="right"),
+            Column("p-value", justify="right"),
+            Column("Verdict"),
+            title=f"Comparison against baseline {baseline.revision} ({baseline.timestamp})",
+            caption=f"median times, threshold {self.regression_threshold:.0%}, significance {self.significance}",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for comparison in comparisons:
+            table.add_row(*comparison.to_table_row())
+        console.print(table)
+
+        regressed = [comparison.name for comparison in comparisons if comparison.is_regression]
+        if regressed:
+            raise RegressionError(f"regressed compared to baseline {baseline.revision}: {', '.join(regressed)}")
+
     def _export_results_to_console(self, results: ProfileResults) -> None:
         """Print profile results to console."""
         console = Console()
         console.print("")
+        environment = results.environment
         table = Table(
             Column("Part", style="cyan"),
             Column("N", justify="right", style="cyan"),
             Column("Average", justify="right", style="yellow"),
+            Column("Median", justify="right", style="yellow"),
+            Column("Std", justify="right", style="yellow"),
             Column("Min", justify="right", style="green"),
             Column("Max", justify="right", style="red"),
+            Column("P90", justify="right", style="red"),
+            Column("P99", justify="right", style="red"),
+            Column("95% CI", justify="right", style="yellow"),
             title=f"Profiling results for day {self.day}",
+            caption=(
+                None
+                if environment is None
+                else f"Python {environment.python_version}, numpy {environment.numpy_version}, {environment.cpu_model}"
+            ),
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for row in results.to_table_rows():
+            table.add_row(*row)
+        console.print(table)
+
+        memory_rows = results.to_memory_table_rows()
+        if not memory_rows:
+            return
+        console.print("")
+        memory_table = Table(
+            Column("Part", style="cyan"),
+            Column("Peak", justify="right", style="red"),
+            Column("Net", justify="right", style="yellow"),
+            Column("Max RSS", justify="right", style="red"),
+            Column("Top allocation sites", style="green"),
+            title=f"Memory usage for day {self.day}",
             show_header=True,
             header_style="bold",
             box=box.ROUNDED,
         )
-        table.add_row(*results.a.to_table_row())
-        table.add_row(*results.b.to_table_row())
+        for row in memory_rows:
+            memory_table.add_row(*row)
+        console.print(memory_table)
+
+    def _export_instrumentation_to_console(self, results: ProfileResults) -> None:
+        """Print hot path sections and counters of the instrumented runs to console."""
+        instrumentation_rows = results.to_instrumentation_table_rows()
+        if not instrumentation_rows:
+            return
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Part", style="cyan"),
+            Column("Section", style="cyan"),
+            Column("Count", justify="right", style="yellow"),
+            Column("Time", justify="right", style="red"),
+            Column("Throughput", justify="right", style="green"),
+            title=f"Hot paths for day {self.day}",
+            caption="from a single instrumented run of each part",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for row in instrumentation_rows:
+            table.add_row(*row)
         console.print(table)
 
 
+class DayProfileResult(NamedTuple):
+    day: Day
+    results: ProfileResults | None
+    elapsed_time: float
+    error: str | None = None
+
+
+class ProfileAllCommand(CommandBase):
+    budget: float
+    precision: float
+    worker_count: int
+    warmup_count: int
+    output_file_name: str
+    isolation: Isolation
+
+    def __init__(
+        self,
+        budget: float,
+        precision: float,
+        output_file_name: str,
+        warmup_count: int = 1,
+        worker_count: int | None = None,
+        isolation: Isolation = Isolation.SNAPSHOT,
+    ):
+        super().__init__()
+        self.budget = budget
+        self.precision = precision
+        self.output_file_name = output_file_name
+        self.warmup_count = warmup_count
+        self.worker_count = worker_count or os.cpu_count() or 1
+        self.isolation = isolation
+
+    def run(self) -> None:
+        """Profile every implemented day within the time budget."""
+        estimates = [
+            DayEstimate.from_results(day, self._read_previous_results(day)) for day in self.get_implemented_days()
+        ]
+        schedule = schedule_days(
+            estimates,
+            budget=self.budget,
+            worker_count=self.worker_count,
+            precision=self.precision,
+            warmup_count=self.warmup_count,
+        )
+        print(
+            f"AoC-{self.year}, profiling {len(schedule)} days using {self.worker_count} workers "
+            f"within a budget of {format_time(self.budget)} ..."
+        )
+        for scheduled_day in schedule:
+            expected = "unknown" if scheduled_day.expected_time is None else format_time(scheduled_day.expected_time)
+            print(f"day {scheduled_day.day}: {scheduled_day.run_count} runs, expected time {expected}")
+
+        start = timer()
+        day_results = []
+        # days are submitted longest first, so the pool picks them up in that order
+        with ProcessPoolExecutor(max_workers=self.worker_count) as executor:
+            futures = [executor.submit(self._profile_day, scheduled_day) for scheduled_day in schedule]
+            for future in as_completed(futures):
+                day_result = future.result()
+                status = "done" if day_result.error is None else f"[red]failed: {day_result.error}[/red]"
+                print(f"day {day_result.day}: {status} ({format_time(day_result.elapsed_time)})")
+                day_results.append(day_result)
+        wall_time = timer() - start
+
+        self._export_results_to_console(sorted(day_results), wall_time)
+        if any(day_result.error is not None for day_result in day_results):
+            raise ValueError("one or more days failed")
+
+    def _read_previous_results(self, day: Day) -> ProfileResults | None:
+        """Return previous profiling results of the day, if there are any."""
+        output_file_path = self.get_solution_dir_path(day) / self.output_file_name
+        try:
+            return ProfileResults.from_file(output_file_path)
+        except (OSError, ValueError):
+            return None
+
+    def _profile_day(self, scheduled_day: ScheduledDay) -> DayProfileResult:
+        """Profile a single day, run inside a worker process."""
+        expected_time = scheduled_day.expected_time
+        start = timer()
+        try:
+            # silence progress output so that it doesn't garble the shared terminal
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                results = ProfileCommand(
+                    day=scheduled_day.day,
+                    run_count=scheduled_day.run_count,
+                    warmup_count=scheduled_day.warmup_count,
+                    # leave room for noise, but keep a single slow phase from using up the whole budget
+                    cut_off_time=self.budget if expected_time is None else min(self.budget, 2 * expected_time),
+                    output_file_name=self.output_file_name,
+                    force_rerun=True,
+                    isolation=self.isolation,
+                ).profile_and_save()
+        except Exception as e:
+            return DayProfileResult(day=scheduled_day.day, results=None, elapsed_time=timer() - start, error=str(e))
+        return DayProfileResult(day=scheduled_day.day, results=results, elapsed_time=timer() - start)
+
+    def _export_results_to_console(self, day_results: list[DayProfileResult], wall_time: float) -> None:
+        """Print profile results of all days in one table."""
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Day", justify="right", style="cyan"),
+            Column("Part", style="cyan"),
+            Column("N", justify="right", style="cyan"),
+            Column("Median", justify="right", style="yellow"),
+            Column("Min", justify="right", style="green"),
+            Column("P90", justify="right", style="red"),
+            Column("95% CI", justify="right", style="yellow"),
+            title=f"Profiling results for AoC-{self.year}",
+            caption=(
+                f"total wall time: {format_time(wall_time)} of {format_time(self.budget)} budget "
+                f"on {self.worker_count} workers"
+            ),
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for day_result in day_results:
+            if day_result.results is None:
+                table.add_row(str(day_result.day), f"[red]failed: {day_result.error}[/red]", end_section=True)
+                continue
+            rows = day_result.results.to_summary_table_rows()
+            for i, row in enumerate(rows):
+                table.add_row(str(day_result.day) if i == 0 else "", *row, end_section=i == len(rows) - 1)
+        console.print(table)
+
+
+def _get_max_rss() -> int:
+    """Return max resident set size of the process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes while Linux reports kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
 @app.command()
 def profile(
-    day: Annotated[int, typer.Argument(min=1, max=25)],
+    day: Annotated[int | None, typer.Argument(min=1, max=25)] = None,
     run_count: Annotated[int, typer.Option(help="number of times to run code")] = 10,
+    warmup_count: Annotated[int, typer.Option(min=0, help="number of untimed runs before each profiled phase")] = 1,
     cut_off_time: Annotated[
         float, typer.Option(help="upper limit in seconds for total time usage on profiling a solution")
     ] = 30,
@@ -113,16 +650,88 @@ def profile(
         str, typer.Option("--output", "-o", help="file name for output file")
     ] = "profiling.json",
     force_rerun: Annotated[bool, typer.Option("--force-rerun", "-f", help="rerun profiling")] = False,
+    memory: Annotated[
+        bool, typer.Option("--memory", help="also record peak memory, net allocations and top allocation sites")
+    ] = False,
+    instrument: Annotated[
+        bool,
+        typer.Option("--instrument", help="also record call counts, time and throughput of instrumented hot paths"),
+    ] = False,
+    hotspots: Annotated[
+        bool, typer.Option("--hotspots", help="capture a cProfile run of each part and write a speedscope file")
+    ] = False,
+    hotspot_count: Annotated[int, typer.Option(min=1, help="number of functions to show with '--hotspots'")] = 15,
+    record_baseline: Annotated[
+        bool, typer.Option("--baseline", help="rerun profiling and record the results as the new baseline")
+    ] = False,
+    compare: Annotated[
+        bool, typer.Option("--compare", help="rerun profiling and fail if a part regressed against the baseline")
+    ] = False,
+    regression_threshold: Annotated[
+        float, typer.Option("--threshold", min=0, help="relative slowdown of the median that counts as a regression")
+    ] = 0.1,
+    significance: Annotated[
+        float, typer.Option(min=0, max=1, help="significance level of the Mann-Whitney U test used by '--compare'")
+    ] = 0.05,
+    isolation: Annotated[
+        Isolation,
+        typer.Option(help="start each run from the parsed state by restoring a snapshot or by forking a child per run"),
+    ] = Isolation.SNAPSHOT,
+    use_parse_cache: Annotated[
+        bool, typer.Option("--parse-cache", help="reuse parsed input from the cache if available")
+    ] = False,
+    profile_all: Annotated[
+        bool, typer.Option("--all", help="profile every implemented day within the time budget")
+    ] = False,
+    budget: Annotated[float, typer.Option(min=0, help="total time in seconds for '--all'")] = 300,
+    precision: Annotated[
+        float,
+        typer.Option(min=0, help="target half-width of the 95% CI relative to the mean, used by '--all'"),
+    ] = 0.05,
+    worker_count: Annotated[
+        int | None, typer.Option("--workers", min=1, help="number of days profiled at the same time by '--all'")
+    ] = None,
 ):
     """Profile the solutions for the queried day."""
     try:
+        if profile_all:
+            if day is not None:
+                raise ValueError("day cannot be given together with '--all'")
+            if memory or instrument or hotspots or record_baseline or compare:
+                raise ValueError(
+                    "'--memory', '--instrument', '--hotspots', '--baseline' and '--compare' need a single day"
+                )
+            ProfileAllCommand(
+                budget=budget,
+                precision=precision,
+                output_file_name=output_file_name,
+                warmup_count=warmup_count,
+                worker_count=worker_count,
+                isolation=isolation,
+            ).run()
+            return
+        if day is None:
+            raise ValueError("day is required unless '--all' is given")
         ProfileCommand(
             day=day,
             run_count=run_count,
+            warmup_count=warmup_count,
             cut_off_time=cut_off_time,
             output_file_name=output_file_name,
             force_rerun=force_rerun,
+            memory=memory,
+            instrument=instrument,
+            hotspot_count=hotspot_count if hotspots else None,
+            record_baseline=record_baseline,
+            compare=compare,
+            regression_threshold=regression_threshold,
+            significance=significance,
+            isolation=isolation,
+            use_parse_cache=use_parse_cache,
         ).run()
+    except RegressionError as e:
+        print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
     except Exception as e:
         print(f"failed to profile solution: {e}")
         raise typer.Exit(1)
@@ -0,0 +1,166 @@
+import json
+import os
+import socketserver
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Any, NamedTuple
+
+import typer
+from rich import print
+from typing_extensions import Annotated
+
+from cli.utils.abstract_command import CommandBase
+from cli.utils.day import Day
+from cli.utils.format_time import format_time
+from cli.utils.part import Part
+from cli.utils.serve_client import SOCKET_PATH
+from utilities.solution_abstract import SolutionAbstract
+
+app = typer.Typer()
+
+
+class WarmSolution(NamedTuple):
+    """Parsed solution kept resident between requests."""
+
+    source_mtime: int
+    input_mtime: int
+    instance: SolutionAbstract
+    snapshot: bytes
+
+
+class ServeCommand(CommandBase):
+    socket_path: Path
+    warm_solutions: dict[tuple[Day, str], WarmSolution]
+    is_running: bool
+
+    def __init__(self, socket_path: Path | None = None):
+        super().__init__()
+        self.socket_path = self.root_path / SOCKET_PATH if socket_path is None else socket_path
+        self.warm_solutions = {}
+        self.is_running = False
+
+    def run(self) -> None:
+        """Answer requests on the socket until a stop request is received."""
+        command = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                response = command.handle_request(json.loads(self.rfile.readline()))
+                self.wfile.write(json.dumps(response).encode())
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        # requests are handled one at a time, since solutions modify their parsed state while solving
+        with socketserver.UnixStreamServer(str(self.socket_path), RequestHandler) as server:
+            print(f"serving AoC-{self.year} on '{self.socket_path}' ...")
+            self.is_running = True
+            try:
+                while self.is_running:
+                    server.handle_request()
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+        print("server stopped")
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Return response to a single request."""
+        try:
+            match request["command"]:
+                case "solve":
+                    return self._solve(request["day"], Part(request["part"]), request["inputFile"])
+                case "profile":
+                    return self._profile(
+                        request["day"], Part(request["part"]), request["inputFile"], request["runCount"]
+                    )
+                case "stop":
+                    self.is_running = False
+                    return {}
+                case unknown:
+                    raise ValueError(f"unknown command '{unknown}'")
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _solve(self, day: Day, part: Part, input_file_name: str) -> dict[str, Any]:
+        """Solve part from the warm state of the day."""
+        warm_solution, status = self._get_warm_solution(day, input_file_name)
+        warm_solution.instance.restore_snapshot(warm_solution.snapshot)
+        start = timer()
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            answer = warm_solution.instance.solve(part)
+        elapsed_time = timer() - start
+        print(f"day {day}, part {part}: {answer} ({format_time(elapsed_time)}, {status})")
+        return {"answer": str(answer), "elapsedTime": elapsed_time, "status": status}
+
+    def _profile(self, day: Day, part: Part, input_file_name: str, run_count: int) -> dict[str, Any]:
+        """Time run_count runs of the part, each starting from the parsed state."""
+        warm_solution, status = self._get_warm_solution(day, input_file_name)
+        times = []
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for _ in range(run_count):
+                warm_solution.instance.restore_snapshot(warm_solution.snapshot)
+                start = timer()
+                warm_solution.instance.solve(part)
+                times.append(timer() - start)
+        print(f"day {day}, part {part}: profiled {run_count} runs ({status})")
+        return {"times": times, "status": status}
+
+    def _get_warm_solution(self, day: Day, input_file_name: str) -> tuple[WarmSolution, str]:
+        """Return warm solution and how it was obtained.
+
+        The solution modules are only reloaded if a source file changed, and the input is only parsed
+        again after a reload or if the input file changed.
+        """
+        input_file_path = self.get_solution_dir_path(day) / input_file_name
+        if not input_file_path.exists():
+            raise ValueError("could not find input file")
+        source_mtime = self._get_source_mtime(day)
+        input_mtime = input_file_path.stat().st_mtime_ns
+
+        warm_solution = self.warm_solutions.get((day, input_file_name))
+        if warm_solution is not None and warm_solution.source_mtime == source_mtime:
+            if warm_solution.input_mtime == input_mtime:
+                return warm_solution, "warm"
+            status = "parsed"
+        elif warm_solution is not None:
+            self._unload_modules(day)
+            status = "reloaded"
+        else:
+            status = "loaded"
+
+        instance = self.get_solution_class(day)(input_file_path)
+        warm_solution = WarmSolution(
+            source_mtime=source_mtime, input_mtime=input_mtime, instance=instance, snapshot=instance.take_snapshot()
+        )
+        self.warm_solutions[(day, input_file_name)] = warm_solution
+        return warm_solution, status
+
+    def _get_source_mtime(self, day: Day) -> int:
+        """Return latest modification time of the source files the solution depends on."""
+        source_files = [
+            source_file
+            for source_dir in self.get_solution_class(day).get_source_dirs()
+            for source_file in source_dir.rglob("*.py")
+        ]
+        return max((source_file.stat().st_mtime_ns for source_file in source_files), default=0)
+
+    def _unload_modules(self, day: Day) -> None:
+        """Remove modules of the day and the shared utilities so that they are imported again."""
+        package_names = [self.get_solution_dir_path(day).name, "utilities"]
+        for module_name in list(sys.modules):
+            if any(module_name == name or module_name.startswith(f"{name}.") for name in package_names):
+                del sys.modules[module_name]
+
+
+@app.command()
+def serve(
+    socket_path: Annotated[
+        Path | None, typer.Option("--socket", help="path of the unix socket, defaults to '.cache/serve.sock'")
+    ] = None,
+):
+    """Keep solutions imported and inputs parsed, answering requests from 'client.py'."""
+    try:
+        ServeCommand(socket_path=socket_path).run()
+    except Exception as e:
+        print(f"failed to serve: {e}")
+        raise typer.Exit(1)
@@ -1,12 +1,26 @@
+import inspect
+import linecache
+import os
+import time
+from contextlib import redirect_stdout
 from pathlib import Path
+from timeit import default_timer as timer
+from typing import TYPE_CHECKING, NamedTuple
 
 import typer
-from rich import print
+from rich import box, print
+from rich.console import Console
 from typing_extensions import Annotated
 
 from cli.utils.abstract_command import CommandBase
-from cli.utils.day import Day
-from cli.utils.part import Part, PartArg
+from cli.utils.day import Day, parse_day_range
+from cli.utils.format_time import format_time
+from cli.utils.part import Part, SolvePartArg
+from utilities.parse_cache import ParseCacheStats
+
+if TYPE_CHECKING:
+    from cli.utils.module_watcher import ModuleWatcher
+    from utilities.solution_abstract import SolutionAbstract
 
 app = typer.Typer()
 
@@ -16,8 +30,15 @@ class SolveCommand(CommandBase):
     part: Part
     input_file_name: str
 
-    def __init__(self, day: Day, part: Part, input_file_name: str):
-        super().__init__()
+    def __init__(
+        self,
+        day: Day,
+        part: Part,
+        input_file_name: str,
+        use_parse_cache: bool = False,
+        use_answer_cache: bool = True,
+    ):
+        super().__init__(use_parse_cache=use_parse_cache, use_answer_cache=use_answer_cache)
         self.day = day
         self.part = part
         self.input_file_name = input_file_name
@@ -26,9 +47,271 @@ class SolveCommand(CommandBase):
         """Return answer to the requested part with the given input choice."""
         print(f"AoC-{self.year}, day {self.day}, part {self.part}")
         print(f"computing solution with input from '{self.input_file_name}'...")
-        solution_instance = self.get_solution_instance(day=self.day, input_file_name=self.input_file_name)
-        solution = solution_instance.solve(self.part)
+        # always recompute, so that solve can be used to verify the cached answer
+        solution, _ = self.get_answer(
+            day=self.day, part=self.part, input_file_name=self.input_file_name, read_answer_cache=False
+        )
         print(f"solution: {solution}")
+        self.print_parse_cache_stats()
+
+
+class SolveBothCommand(CommandBase):
+    day: Day
+    input_file_name: str
+
+    def __init__(self, day: Day, input_file_name: str, use_parse_cache: bool = False, use_answer_cache: bool = True):
+        super().__init__(use_parse_cache=use_parse_cache, use_answer_cache=use_answer_cache)
+        self.day = day
+        self.input_file_name = input_file_name
+
+    def run(self) -> None:
+        """Parse the input once and solve both parts in parallel."""
+        print(f"AoC-{self.year}, day {self.day}, both parts")
+        print(f"computing solutions with input from '{self.input_file_name}'...")
+        solution_instance = self.get_solution_instance(day=self.day, input_file_name=self.input_file_name)
+        start = timer()
+        results = self._solve_parts(solution_instance)
+        wall_time = timer() - start
+        for part, (answer, elapsed_time) in results.items():
+            print(f"part {part} solution: {answer} ({format_time(elapsed_time)})")
+            if self.answer_cache is not None:
+                self.answer_cache.put(self.get_answer_cache_key(self.day, part, self.input_file_name), answer)
+        print(f"total wall time: {format_time(wall_time)}")
+        self.print_parse_cache_stats()
+
+    @staticmethod
+    def _solve_parts(solution_instance: "SolutionAbstract") -> dict[Part, tuple[str, float]]:
+        """Return answer and run time of each part.
+
+        Each part runs in its own forked child, which shares the parsed state with this process
+        copy-on-write, so solutions that modify their state do not affect each other. Without fork
+        support the parts are solved one after the other, each starting from a snapshot of the parsed state.
+        """
+
+        def solve(part: Part) -> str:
+            # silence progress bars from the solutions so they don't garble the shared terminal
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                return str(solution_instance.solve(part))
+
+        if hasattr(os, "fork"):
+            from cli.utils.isolation import ForkedRun
+
+            runs = {part: ForkedRun(lambda part=part: solve(part)) for part in Part}
+            return {part: run.result() for part, run in runs.items()}
+
+        snapshot = solution_instance.take_snapshot()
+        results = {}
+        for part in Part:
+            solution_instance.restore_snapshot(snapshot)
+            start = timer()
+            results[part] = (solve(part), timer() - start)
+        return results
+
+
+class SolveWatchCommand(SolveCommand):
+    poll_interval: float
+    solution_instance: "SolutionAbstract | None"
+    snapshot: bytes | None
+    parse_source: str | None
+    input_mtime: int | None
+
+    def __init__(self, day: Day, part: Part, input_file_name: str, poll_interval: float = 0.5):
+        super().__init__(day=day, part=part, input_file_name=input_file_name, use_answer_cache=False)
+        self.poll_interval = poll_interval
+        self.solution_instance = None
+        self.snapshot = None
+        self.parse_source = None
+        self.input_mtime = None
+
+    @property
+    def input_file_path(self) -> Path:
+        """Return path to input file."""
+        return self.get_solution_dir_path(self.day) / self.input_file_name
+
+    def run(self) -> None:
+        """Solve the requested part again whenever the solution or the input changes."""
+        from cli.utils.module_watcher import ModuleWatcher
+
+        solution_dir_path = self.get_solution_dir_path(self.day)
+        print(f"AoC-{self.year}, day {self.day}, part {self.part}")
+        print(f"watching '{solution_dir_path}' for changes, press Ctrl+C to stop ...")
+        watcher = ModuleWatcher(package_name=solution_dir_path.name, package_path=solution_dir_path)
+        try:
+            self._update(watcher, changed_modules=[])
+            while True:
+                time.sleep(self.poll_interval)
+                changed_modules = watcher.get_changed_modules()
+                if changed_modules or self._get_input_mtime() != self.input_mtime:
+                    print("")
+                    self._update(watcher, changed_modules)
+        except KeyboardInterrupt:
+            print("stopped watching")
+
+    def _update(self, watcher: "ModuleWatcher", changed_modules: list[str]) -> None:
+        """Reload changed modules, parse the input again if needed and print the new answer."""
+        try:
+            reloaded_modules = watcher.reload(changed_modules)
+            if reloaded_modules:
+                print(f"reloaded {', '.join(reloaded_modules)}")
+            solution_class = self.get_solution_class(self.day)
+            parse_source = _get_parse_source(solution_class)
+            input_mtime = self._get_input_mtime()
+            # the parsed state may hold instances of any reloaded module except the solution module itself
+            if (
+                self.solution_instance is not None
+                and self.snapshot is not None
+                and input_mtime == self.input_mtime
+                and parse_source == self.parse_source
+                and set(reloaded_modules) <= {solution_class.__module__}
+            ):
+                print("reusing parsed input ...")
+                self.solution_instance.__class__ = solution_class
+                self.solution_instance.restore_snapshot(self.snapshot)
+            else:
+                print(f"parsing input from '{self.input_file_name}' ...")
+                self.solution_instance = solution_class(self.input_file_path)
+                self.snapshot = self.solution_instance.take_snapshot()
+            self.parse_source = parse_source
+            self.input_mtime = input_mtime
+
+            start = timer()
+            solution = self.solution_instance.solve(self.part)
+            print(f"solution: {solution} ({format_time(timer() - start)})")
+        except Exception as e:
+            print(f"[red]failed to solve: {e}[/red]")
+
+    def _get_input_mtime(self) -> int | None:
+        """Return modification time of the input file, or None if it does not exist."""
+        try:
+            return self.input_file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+
+def _get_parse_source(solution_class: type) -> str | None:
+    """Return current source code of the _parse_input method."""
+    linecache.checkcache()
+    try:
+        return inspect.getsource(solution_class._parse_input)
+    except (OSError, TypeError):
+        return None
+
+
+class SolveResult(NamedTuple):
+    day: Day
+    part: Part
+    answer: str | None
+    elapsed_time: float
+    error: str | None = None
+    parse_cache_stats: ParseCacheStats | None = None
+    is_cached: bool = False
+
+    def to_table_row(self) -> tuple[str, str, str, str]:
+        """Return row for rich.Table."""
+        answer = self.answer if self.error is None else f"[red]failed: {self.error}[/red]"
+        elapsed_time = format_time(self.elapsed_time)
+        if self.is_cached:
+            elapsed_time += " (cached)"
+        return (str(self.day), str(self.part), answer, elapsed_time)
+
+
+class SolveAllCommand(CommandBase):
+    days: list[Day]
+    input_file_name: str
+    worker_count: int
+
+    def __init__(
+        self,
+        days: list[Day] | None,
+        input_file_name: str,
+        use_parse_cache: bool = False,
+        use_answer_cache: bool = True,
+    ):
+        super().__init__(use_parse_cache=use_parse_cache, use_answer_cache=use_answer_cache)
+        implemented_days = self.get_implemented_days()
+        if days is None:
+            self.days = implemented_days
+        else:
+            missing_days = sorted(set(days).difference(implemented_days))
+            if missing_days:
+                print(f"[yellow]skipping days without a solution: {', '.join(map(str, missing_days))}[/yellow]")
+            self.days = [day for day in days if day in implemented_days]
+        if not self.days:
+            raise ValueError("no implemented days to solve")
+        self.input_file_name = input_file_name
+        self.worker_count = os.cpu_count() or 1
+
+    def run(self) -> None:
+        """Solve both parts of every selected day in a process pool."""
+        # imported here since the process pool and table are only needed when solving several days
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        print(f"AoC-{self.year}, solving {len(self.days)} days using {self.worker_count} workers ...")
+        start = timer()
+        results = []
+        with ProcessPoolExecutor(max_workers=self.worker_count) as executor:
+            futures = [executor.submit(self._solve_part, day, part) for day in self.days for part in Part]
+            for future in as_completed(futures):
+                results.append(future.result())
+        wall_time = timer() - start
+
+        self._export_results_to_console(sorted(results), wall_time)
+        if self.parse_cache is not None:
+            self.print_parse_cache_stats(sum((r.parse_cache_stats for r in results), start=ParseCacheStats()))
+        if any(result.error is not None for result in results):
+            raise ValueError("one or more solutions failed")
+
+    def _solve_part(self, day: Day, part: Part) -> SolveResult:
+        """Solve a single part, run inside a worker process."""
+        start = timer()
+        try:
+            # silence progress bars from the solutions so they don't garble the shared terminal
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                answer, is_cached = self.get_answer(day=day, part=part, input_file_name=self.input_file_name)
+        except Exception as e:
+            return SolveResult(
+                day=day,
+                part=part,
+                answer=None,
+                elapsed_time=timer() - start,
+                error=str(e),
+                parse_cache_stats=self._get_parse_cache_stats(),
+            )
+        return SolveResult(
+            day=day,
+            part=part,
+            answer=answer,
+            elapsed_time=timer() - start,
+            parse_cache_stats=self._get_parse_cache_stats(),
+            is_cached=is_cached,
+        )
+
+    def _get_parse_cache_stats(self) -> ParseCacheStats:
+        """Return parse cache stats collected in this process."""
+        if self.parse_cache is None:
+            return ParseCacheStats()
+        return self.parse_cache.stats
+
+    def _export_results_to_console(self, results: list[SolveResult], wall_time: float) -> None:
+        """Print solve results to console."""
+        from rich.table import Column, Table
+
+        console = Console()
+        console.print("")
+        table = Table(
+            Column("Day", justify="right", style="cyan"),
+            Column("Part", style="cyan"),
+            Column("Answer", justify="right", style="green"),
+            Column("Time", justify="right", style="yellow"),
+            title=f"Solutions for AoC-{self.year}",
+            caption=f"total wall time: {format_time(wall_time)}",
+            show_header=True,
+            header_style="bold",
+            box=box.ROUNDED,
+        )
+        for result in results:
+            table.add_row(*result.to_table_row())
+        console.print(table)
 
 
 def input_file_name_callback(input_file_name: str):
@@ -41,18 +324,61 @@ def input_file_name_callback(input_file_name: str):
 
 @app.command()
 def solve(
-    day: Day,
-    part: PartArg,
+    day: Annotated[int | None, typer.Argument(min=1, max=25)] = None,
+    part: Annotated[SolvePartArg | None, typer.Argument(help="part to solve, 'both' solves them in parallel")] = None,
     input_file_name: Annotated[
         str,
         typer.Option(
             "--input-file", "-i", callback=input_file_name_callback, help="filename of file to read input data from"
         ),
     ] = "input.txt",
+    solve_all: Annotated[bool, typer.Option("--all", help="solve both parts of every implemented day")] = False,
+    days: Annotated[str | None, typer.Option(help="solve both parts of the given days, e.g. '1-13' or '1,3,5'")] = None,
+    use_parse_cache: Annotated[
+        bool, typer.Option("--parse-cache", help="reuse parsed input from the cache if available")
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="neither read nor write computed answers in the answer cache")
+    ] = False,
+    watch: Annotated[
+        bool, typer.Option("--watch", help="solve again whenever the solution or the input file changes")
+    ] = False,
 ):
     """Return answer to the requested part with the given input choice."""
     try:
-        SolveCommand(day=day, part=part.to_part(), input_file_name=input_file_name).run()
+        if solve_all or days is not None:
+            if day is not None:
+                raise ValueError("day cannot be given together with '--all' or '--days'")
+            if watch:
+                raise ValueError("'--watch' cannot be used together with '--all' or '--days'")
+            day_list = None if days is None else parse_day_range(days)
+            SolveAllCommand(
+                days=day_list,
+                input_file_name=input_file_name,
+                use_parse_cache=use_parse_cache,
+                use_answer_cache=not no_cache,
+            ).run()
+            return
+        if day is None or part is None:
+            raise ValueError("day and part are required unless '--all' or '--days' is given")
+        if part == SolvePartArg.BOTH:
+            if watch:
+                raise ValueError("'--watch' cannot be used to solve both parts")
+            SolveBothCommand(
+                day=day, input_file_name=input_file_name, use_parse_cache=use_parse_cache, use_answer_cache=not no_cache
+            ).run()
+            return
+        (single_part,) = part.to_parts()
+        if watch:
+            SolveWatchCommand(day=day, part=single_part, input_file_name=input_file_name).run()
+            return
+        SolveCommand(
+            day=day,
+            part=single_part,
+            input_file_name=input_file_name,
+            use_parse_cache=use_parse_cache,
+            use_answer_cache=not no_cache,
+        ).run()
     except Exception as e:
         print(f"failed to solve: {e}")
         raise typer.Exit(1)
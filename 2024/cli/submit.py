@@ -3,11 +3,11 @@ import typer
 from bs4 import BeautifulSoup
 from requests.models import Response
 from rich import print
+from typing_extensions import Annotated
 
 from cli.utils.abstract_command import CommandBase
 from cli.utils.day import Day
 from cli.utils.part import Part, PartArg
-from utilities.solution_abstract import SolutionAbstract
 
 app = typer.Typer()
 
@@ -15,19 +15,20 @@ app = typer.Typer()
 class SubmitCommand(CommandBase):
     day: Day
     part: Part
-    solution_instance: SolutionAbstract
 
-    def __init__(self, day: Day, part: Part):
-        super().__init__()
+    def __init__(self, day: Day, part: Part, use_parse_cache: bool = False, use_answer_cache: bool = True):
+        super().__init__(use_parse_cache=use_parse_cache, use_answer_cache=use_answer_cache)
         self.day = day
         self.part = part
-        self.solution_instance = self.get_solution_instance(self.day, input_file_name="input.txt")
 
     def run(self) -> None:
         """Submit solution of given part to AoC."""
         print(f"AoC-{self.year}, day {self.day}, part {self.part}")
         print("computing answer value ...")
-        answer = self.solution_instance.solve(self.part)
+        answer, is_cached = self.get_answer(self.day, self.part, input_file_name="input.txt")
+        if is_cached:
+            print("[yellow]answer read from the answer cache, use '--no-cache' to recompute it[/yellow]")
+        self.print_parse_cache_stats()
 
         print(f"submitting answer value '{answer}' ...")
         response = self._post_request(answer)
@@ -37,9 +38,9 @@ class SubmitCommand(CommandBase):
         parsed_response = self._parse_response(response.text)
         print(f"response from AoC: {parsed_response}")
 
-    def _post_request(self, answer: int) -> Response:
+    def _post_request(self, answer: str) -> Response:
         """Post results to AoC."""
-        url = f"https://adventofcode.com/{self.year}/day/{self.day}/answer"
+        url = f"{self.base_url}/{self.year}/day/{self.day}/answer"
         data = {"level": str(self.part), "answer": str(answer)}
         return requests.post(url, cookies={"session": self.session_token}, data=data)
 
@@ -71,10 +72,18 @@ class SubmitCommand(CommandBase):
 def submit(
     day: Day,
     part: PartArg,
+    use_parse_cache: Annotated[
+        bool, typer.Option("--parse-cache", help="reuse parsed input from the cache if available")
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="recompute the answer instead of using the answer cache")
+    ] = False,
 ):
     """Submit solution of given part to AoC."""
     try:
-        SubmitCommand(day=day, part=part.to_part()).run()
+        SubmitCommand(
+            day=day, part=part.to_part(), use_parse_cache=use_parse_cache, use_answer_cache=not no_cache
+        ).run()
     except Exception as e:
         print(f"failed to submit: {e}")
         raise typer.Exit(1)
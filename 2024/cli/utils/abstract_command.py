@@ -1,10 +1,25 @@
+import hashlib
 import os
 import re
 from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cli.utils.day import Day
-from utilities.solution_abstract import SolutionAbstract
+from rich import print
+
+from cli.utils.answer_cache import AnswerCache, AnswerCacheKey
+from cli.utils.day import FIRST_DAY, LAST_DAY, Day
+from cli.utils.format_time import format_time
+from cli.utils.part import Part
+from utilities.parse_cache import ParseCache, ParseCacheStats, hash_source_files
+
+if TYPE_CHECKING:
+    # only needed for annotations, importing it would pull numpy into every command
+    from utilities.solution_abstract import SolutionAbstract
+
+PARSE_CACHE_DIR = Path(".cache/parse")
+ANSWER_CACHE_DIR = Path(".cache/answers")
+DEFAULT_BASE_URL = "https://adventofcode.com"
 
 
 class CommandBase:
@@ -13,8 +28,11 @@ class CommandBase:
     year: int
     root_path: Path
     session_token: str
+    base_url: str
+    parse_cache: ParseCache | None
+    answer_cache: AnswerCache | None
 
-    def __init__(self):
+    def __init__(self, use_parse_cache: bool = False, use_answer_cache: bool = False):
         try:
             os.environ["AOC_YEAR"]
         except KeyError:
@@ -36,19 +54,73 @@ class CommandBase:
             self.session_token = os.environ["AOC_SESSION_TOKEN"]
         except KeyError:
             raise ValueError("environment variable 'AOC_SESSION_TOKEN' is not set")
+        # can point to a local stand-in server for testing
+        self.base_url = os.environ.get("AOC_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+        self.parse_cache = ParseCache(self.root_path / PARSE_CACHE_DIR) if use_parse_cache else None
+        self.answer_cache = AnswerCache(self.root_path / ANSWER_CACHE_DIR) if use_answer_cache else None
 
     def get_solution_dir_path(self, day: Day) -> Path:
         """Return path to the directory for the queried day."""
         return self.root_path / f"day{day:0>2}"
 
-    def get_solution_instance(self, day: Day, input_file_name: str) -> SolutionAbstract:
-        """Return requested solution class instance."""
+    def get_implemented_days(self) -> list[Day]:
+        """Return days that have a solution module."""
+        return [
+            day for day in range(FIRST_DAY, LAST_DAY + 1) if (self.get_solution_dir_path(day) / "solution.py").exists()
+        ]
+
+    def get_solution_class(self, day: Day) -> type["SolutionAbstract"]:
+        """Return requested solution class."""
         solution_dir_path = self.get_solution_dir_path(day)
 
         try:
             solution_module = import_module(f"{solution_dir_path.name}.solution")
         except ModuleNotFoundError:
             raise ValueError(f"solution for day {day} does not exist yet") from None
-        solution_class = getattr(solution_module, "Solution")
+        return getattr(solution_module, "Solution")
+
+    def get_solution_instance(self, day: Day, input_file_name: str) -> "SolutionAbstract":
+        """Return requested solution class instance."""
+        solution_class = self.get_solution_class(day)
+        return solution_class(self.get_solution_dir_path(day) / input_file_name, parse_cache=self.parse_cache)
+
+    def get_answer(
+        self, day: Day, part: Part, input_file_name: str, read_answer_cache: bool = True
+    ) -> tuple[str, bool]:
+        """Return answer to the requested part and whether it was read from the answer cache.
+
+        Computed answers are written to the answer cache if it is enabled.
+        """
+        if self.answer_cache is None:
+            return str(self.get_solution_instance(day, input_file_name).solve(part)), False
+
+        key = self.get_answer_cache_key(day, part, input_file_name)
+        if read_answer_cache:
+            answer = self.answer_cache.get(key)
+            if answer is not None:
+                return answer, True
+        answer = str(self.get_solution_instance(day, input_file_name).solve(part))
+        self.answer_cache.put(key, answer)
+        return answer, False
+
+    def get_answer_cache_key(self, day: Day, part: Part, input_file_name: str) -> AnswerCacheKey:
+        """Return answer cache key for the given input and the current solution code."""
+        input_file_path = self.get_solution_dir_path(day) / input_file_name
+        if not input_file_path.exists():
+            raise ValueError("could not find input file")
+        return AnswerCacheKey(
+            year=self.year,
+            day=day,
+            part=part,
+            input_hash=hashlib.sha256(input_file_path.read_bytes()).hexdigest(),
+            source_hash=hash_source_files(self.get_solution_class(day).get_source_dirs()),
+        )
 
-        return solution_class(solution_dir_path / input_file_name)
+    def print_parse_cache_stats(self, stats: ParseCacheStats | None = None) -> None:
+        """Print hits, misses and time saved by the parse cache."""
+        if stats is None:
+            if self.parse_cache is None:
+                return
+            stats = self.parse_cache.stats
+        print(f"parse cache: {stats.hits} hits, {stats.misses} misses, saved {format_time(max(stats.saved_time, 0))}")
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+from cli.utils.day import Day
+from cli.utils.part import Part
+
+
+class AnswerCacheKey(NamedTuple):
+    year: int
+    day: Day
+    part: Part
+    input_hash: str
+    source_hash: str
+
+
+class AnswerCacheEntry(NamedTuple):
+    source_hash: str
+    answer: str
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create AnswerCacheEntry from json dict."""
+        return cls(source_hash=json_dict["sourceHash"], answer=json_dict["answer"])
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {"sourceHash": self.source_hash, "answer": self.answer}
+
+
+class AnswerCache:
+    """Persistent cache of computed answers.
+
+    There is one entry per year, day, part and input. An entry is only valid for the source hash it was
+    written with, so changing the solution code invalidates it and the next write replaces it.
+    """
+
+    cache_dir: Path
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def get(self, key: AnswerCacheKey) -> str | None:
+        """Return cached answer, or None if it is not cached or was computed by different code."""
+        try:
+            with self._get_entry_path(key).open("r") as file:
+                entry = AnswerCacheEntry.from_json_dict(json.load(file))
+        except (OSError, ValueError, KeyError):
+            return None
+        if entry.source_hash != key.source_hash:
+            return None
+        return entry.answer
+
+    def put(self, key: AnswerCacheKey, answer: str) -> None:
+        """Store answer in the cache, replacing any entry computed by different code."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._get_entry_path(key)
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with temp_path.open("w") as file:
+            json.dump(AnswerCacheEntry(source_hash=key.source_hash, answer=answer).to_json_dict(), file)
+        temp_path.replace(entry_path)
+
+    def _get_entry_path(self, key: AnswerCacheKey) -> Path:
+        """Return path to cache entry."""
+        name = hashlib.sha256(f"{key.year}-{key.day}-{key.part}-{key.input_hash}".encode()).hexdigest()
+        return self.cache_dir / f"{name}.json"
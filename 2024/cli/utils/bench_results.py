@@ -0,0 +1,48 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from cli.utils.format_size import format_size
+from cli.utils.format_time import format_time
+
+
+class BenchPoint(NamedTuple):
+    scale: float
+    input_size: int
+    time: float
+    peak_memory: int | None = None
+
+
+class BenchCurve(NamedTuple):
+    """Run times of a single phase over increasing input sizes."""
+
+    phase: str
+    points: list[BenchPoint]
+
+    def fit_exponent(self) -> float | None:
+        """Return k of the empirical complexity O(n^k), with n the input size in bytes.
+
+        k is the slope of a least squares fit in log-log space, which needs at least two distinct input sizes.
+        """
+        points = [point for point in self.points if point.time > 0]
+        if len({point.input_size for point in points}) < 2:
+            return None
+        sizes = np.log([point.input_size for point in points])
+        times = np.log([point.time for point in points])
+        slope, _ = np.polyfit(sizes, times, 1)
+        return float(slope)
+
+    def to_table_row(self, scales: list[float]) -> tuple[str, ...]:
+        """Return row for rich.Table with the time at each scale and the fitted exponent."""
+        times = {point.scale: point.time for point in self.points}
+        exponent = self.fit_exponent()
+        return (
+            self.phase,
+            *(format_time(times[scale], precision=2) if scale in times else "-" for scale in scales),
+            "-" if exponent is None else f"O(n^{exponent:.2f})",
+        )
+
+    def to_memory_table_row(self, scales: list[float]) -> tuple[str, ...]:
+        """Return row for rich.Table with the peak memory at each scale."""
+        peaks = {point.scale: point.peak_memory for point in self.points if point.peak_memory is not None}
+        return (self.phase, *(format_size(peaks[scale]) if scale in peaks else "-" for scale in scales))
@@ -2,3 +2,22 @@ import typer
 from typing_extensions import Annotated
 
 Day = Annotated[int, typer.Argument(min=1, max=25)]
+
+FIRST_DAY = 1
+LAST_DAY = 25
+
+
+def parse_day_range(days: str) -> list[Day]:
+    """Parse a day range such as '1-13' or '1,3,5-7' into a sorted list of days."""
+    parsed_days = set()
+    for day_range in days.split(","):
+        start, _, stop = day_range.strip().partition("-")
+        try:
+            first = int(start)
+            last = int(stop) if stop else first
+        except ValueError:
+            raise ValueError(f"invalid day range '{day_range}'") from None
+        if first > last or first < FIRST_DAY or last > LAST_DAY:
+            raise ValueError(f"day range '{day_range}' must be within {FIRST_DAY}-{LAST_DAY}")
+        parsed_days.update(range(first, last + 1))
+    return sorted(parsed_days)
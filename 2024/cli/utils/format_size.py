@@ -0,0 +1,11 @@
+_binary_prefixes = ["B", "KiB", "MiB", "GiB", "TiB"]
+
+
+def format_size(size: int, precision: int = 2) -> str:
+    """Use suitable binary prefix for a size in bytes."""
+    scaled_size = float(size)
+    for prefix in _binary_prefixes[:-1]:
+        if abs(scaled_size) < 1024:
+            return f"{scaled_size:.{precision}f} {prefix}" if prefix != "B" else f"{size} B"
+        scaled_size /= 1024
+    return f"{scaled_size:.{precision}f} {_binary_prefixes[-1]}"
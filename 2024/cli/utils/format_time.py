@@ -0,0 +1,20 @@
+_prefix = {
+    "n": 1e-9,  # nano
+    "u": 1e-6,  # micro
+    "m": 1e-3,  # mili
+}
+
+
+def format_time(seconds: float, precision: int = 3) -> str:
+    """Use suitable SI prefix for time."""
+    if seconds <= _prefix["n"]:
+        nano_seconds = seconds / _prefix["n"]
+        return f"{nano_seconds:.{precision}f} ns"
+    elif seconds <= _prefix["u"]:
+        micro_seconds = seconds / _prefix["u"]
+        return f"{micro_seconds:.{precision}f} μs"
+    elif seconds <= _prefix["m"] * 100:
+        mili_seconds = seconds / _prefix["m"]
+        return f"{mili_seconds:.{precision}f} ms"
+    else:
+        return f"{seconds:.{precision}f} s"
@@ -0,0 +1,146 @@
+import cProfile
+import json
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Self
+
+from cli.utils.format_time import format_time
+
+type FunctionKey = tuple[str, int, str]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+# call stacks below this time are dropped, keeping the number of stacks manageable for large call graphs
+MIN_STACK_TIME = 1e-7  # seconds
+
+
+class FunctionStats(NamedTuple):
+    function: FunctionKey
+    call_count: int
+    total_time: float
+    cumulative_time: float
+
+
+class HotspotResults:
+    """Function level timings of a single run captured with cProfile."""
+
+    stats: pstats.Stats
+    root_path: Path
+
+    def __init__(self, stats: pstats.Stats, root_path: Path):
+        self.stats = stats
+        self.root_path = root_path
+
+    @classmethod
+    def capture(cls, func: Callable[[], Any], root_path: Path) -> Self:
+        """Run func under cProfile."""
+        profiler = cProfile.Profile()
+        profiler.runcall(func)
+        return cls(pstats.Stats(profiler), root_path=root_path)
+
+    @property
+    def total_time(self) -> float:
+        """Return total time spent in the profiled run."""
+        return self.stats.total_tt
+
+    def get_top_functions(self, count: int) -> list[FunctionStats]:
+        """Return the functions with the largest cumulative time."""
+        function_stats = [
+            FunctionStats(function=function, call_count=call_count, total_time=total_time, cumulative_time=cum_time)
+            for function, (_, call_count, total_time, cum_time, _) in self.stats.stats.items()
+        ]
+        return sorted(function_stats, key=lambda stats: stats.cumulative_time, reverse=True)[:count]
+
+    def format_function(self, function: FunctionKey) -> str:
+        """Return readable name of a function with its location relative to the root path."""
+        file_name, line_number, function_name = function
+        if file_name == "~":
+            # builtins have no location
+            return function_name
+        file_path = Path(file_name)
+        if file_path.is_relative_to(self.root_path):
+            file_path = file_path.relative_to(self.root_path)
+        return f"{function_name} ({file_path}:{line_number})"
+
+    def get_collapsed_stacks(self) -> dict[tuple[FunctionKey, ...], float]:
+        """Return self time of each call stack.
+
+        cProfile only records caller/callee pairs, so the time of a function is split between
+        its call stacks in proportion to the time it was called with from each caller.
+        Recursive calls are folded into the outermost call.
+        """
+        callees: dict[FunctionKey, dict[FunctionKey, float]] = defaultdict(dict)
+        for function, (_, _, _, _, callers) in self.stats.stats.items():
+            for caller, (_, _, _, edge_cumulative_time) in callers.items():
+                callees[caller][function] = edge_cumulative_time
+
+        stacks: dict[tuple[FunctionKey, ...], float] = defaultdict(float)
+        # use an explicit stack to avoid hitting the recursion limit on deep call graphs
+        to_visit = [
+            ((function,), cumulative_time)
+            for function, (_, _, _, cumulative_time, callers) in self.stats.stats.items()
+            if not callers
+        ]
+        while to_visit:
+            stack, time = to_visit.pop()
+            function = stack[-1]
+            _, _, total_time, cumulative_time, _ = self.stats.stats[function]
+            ratio = time / cumulative_time if cumulative_time > 0 else 0.0
+            stacks[stack] += total_time * ratio
+            for callee, edge_cumulative_time in callees[function].items():
+                callee_time = edge_cumulative_time * ratio
+                if callee in stack or callee_time < MIN_STACK_TIME:
+                    continue
+                to_visit.append(((*stack, callee), callee_time))
+        return stacks
+
+    def to_speedscope_json(self, name: str) -> str:
+        """Convert to speedscope json string with one weighted sample per call stack."""
+        frame_indices: dict[FunctionKey, int] = {}
+        frames = []
+        samples = []
+        weights = []
+        for stack, time in self.get_collapsed_stacks().items():
+            if time <= 0:
+                continue
+            sample = []
+            for function in stack:
+                if function not in frame_indices:
+                    frame_indices[function] = len(frames)
+                    file_name, line_number, _ = function
+                    frames.append({"name": self.format_function(function), "file": file_name, "line": line_number})
+                sample.append(frame_indices[function])
+            samples.append(sample)
+            weights.append(time)
+
+        out = {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "advent-of-code profile --hotspots",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+        return json.dumps(out)
+
+    def to_table_rows(self, count: int) -> list[tuple[str, str, str, str]]:
+        """Return rows for rich.Table for the functions with the largest cumulative time."""
+        return [
+            (
+                self.format_function(stats.function),
+                str(stats.call_count),
+                format_time(stats.total_time),
+                format_time(stats.cumulative_time),
+            )
+            for stats in self.get_top_functions(count)
+        ]
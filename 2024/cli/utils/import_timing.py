@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from typing import NamedTuple
+
+from rich import box
+from rich.console import Console
+from rich.table import Column, Table
+
+from cli.utils.format_time import format_time
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+class ImportTime(NamedTuple):
+    module: str
+    depth: int
+    self_time: float
+    cumulative_time: float
+
+
+def run_with_import_timing(argv: list[str], top_count: int = 20) -> int:
+    """Rerun the CLI with '-X importtime' and print a summary of the slowest imports.
+
+    Returns the exit code of the rerun command.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", *argv], stderr=subprocess.PIPE, text=True)
+    import_times = []
+    for line in process.stderr.splitlines():
+        if line.startswith(IMPORT_TIME_PREFIX):
+            import_time = _parse_import_time_line(line)
+            if import_time is not None:
+                import_times.append(import_time)
+        else:
+            print(line, file=sys.stderr)
+    _export_import_times_to_console(import_times, top_count)
+    return process.returncode
+
+
+def _parse_import_time_line(line: str) -> ImportTime | None:
+    """Parse a line of '-X importtime' output, returning None for the header line."""
+    self_us, cumulative_us, module = line.removeprefix(IMPORT_TIME_PREFIX).split("|")
+    try:
+        self_time = int(self_us) * 1e-6
+        cumulative_time = int(cumulative_us) * 1e-6
+    except ValueError:
+        return None
+    # nested imports are indented by two spaces per level
+    depth = (len(module) - len(module.lstrip()) - 1) // 2
+    return ImportTime(module=module.strip(), depth=depth, self_time=self_time, cumulative_time=cumulative_time)
+
+
+def _export_import_times_to_console(import_times: list[ImportTime], top_count: int) -> None:
+    """Print the top-level imports with the largest cumulative time."""
+    total_time = sum(import_time.self_time for import_time in import_times)
+    top_level_imports = sorted(
+        (import_time for import_time in import_times if import_time.depth == 0),
+        key=lambda import_time: import_time.cumulative_time,
+        reverse=True,
+    )
+    console = Console(stderr=True)
+    console.print("")
+    table = Table(
+        Column("Module", style="cyan"),
+        Column("Self", justify="right", style="green"),
+        Column("Cumulative", justify="right", style="yellow"),
+        title="Slowest top-level imports",
+        caption=f"total import time: {format_time(total_time)} across {len(import_times)} modules",
+        show_header=True,
+        header_style="bold",
+        box=box.ROUNDED,
+    )
+    for import_time in top_level_imports[:top_count]:
+        table.add_row(import_time.module, format_time(import_time.self_time), format_time(import_time.cumulative_time))
+    console.print(table)
@@ -0,0 +1,55 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from cli.utils.day import Day
+
+
+class InputMirror:
+    """Content-addressed local copy of downloaded inputs.
+
+    Input files are stored under the sha256 hash of their contents in 'objects', and 'refs' maps
+    each year and day to the hash of its input.
+    """
+
+    mirror_dir: Path
+
+    def __init__(self, mirror_dir: Path):
+        self.mirror_dir = mirror_dir
+
+    def get(self, year: int, day: Day) -> bytes | None:
+        """Return mirrored input, or None if it is missing or corrupted."""
+        try:
+            digest = self._get_ref_path(year, day).read_text().strip()
+            input_data = self._get_object_path(digest).read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(input_data).hexdigest() != digest:
+            return None
+        return input_data
+
+    def put(self, year: int, day: Day, input_data: bytes) -> str:
+        """Store input in the mirror and return its hash."""
+        digest = hashlib.sha256(input_data).hexdigest()
+        object_path = self._get_object_path(digest)
+        if not object_path.exists():
+            _write_atomic(object_path, input_data)
+        _write_atomic(self._get_ref_path(year, day), digest.encode())
+        return digest
+
+    def _get_object_path(self, digest: str) -> Path:
+        """Return path to the object with the given hash."""
+        return self.mirror_dir / "objects" / digest[:2] / digest[2:]
+
+    def _get_ref_path(self, year: int, day: Day) -> Path:
+        """Return path to the ref of the given year and day."""
+        return self.mirror_dir / "refs" / str(year) / f"day{day:0>2}"
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """Write data to a temporary file and move it into place."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    temp_path.write_bytes(data)
+    temp_path.replace(file_path)
@@ -0,0 +1,68 @@
+import os
+import pickle
+import sys
+from enum import Enum
+from timeit import default_timer as timer
+from typing import Any, Callable
+
+
+class Isolation(str, Enum):
+    """How repeated runs of a solution are kept from seeing state mutated by earlier runs."""
+
+    NONE = "none"
+    SNAPSHOT = "snapshot"
+    FORK = "fork"
+
+
+class ForkedRun:
+    """Function running in a forked child process.
+
+    The child gets a copy-on-write view of the parent's memory: numpy arrays and other parsed state are
+    shared with the parent without copying until they are written to, and anything func mutates is
+    discarded when the child exits, leaving the parent untouched.
+    """
+
+    pid: int
+    read_fd: int
+
+    def __init__(self, func: Callable[[], Any]):
+        if not hasattr(os, "fork"):
+            raise ValueError("forking is not supported on this platform")
+        # flush buffered output so that it is not written by both processes
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self.read_fd, write_fd = os.pipe()
+        self.pid = os.fork()
+        if self.pid == 0:
+            os.close(self.read_fd)
+            try:
+                start = timer()
+                value = func()
+                result: tuple[bool, Any] = (True, (value, timer() - start))
+            except BaseException as e:
+                result = (False, str(e))
+            with os.fdopen(write_fd, "wb") as file:
+                file.write(pickle.dumps(result))
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # skip cleanup handlers inherited from the parent
+            os._exit(0)
+        os.close(write_fd)
+
+    def result(self) -> tuple[Any, float]:
+        """Wait for the child to finish and return the return value of func and its run time."""
+        with os.fdopen(self.read_fd, "rb") as file:
+            data = file.read()
+        _, status = os.waitpid(self.pid, 0)
+        if not data:
+            raise ValueError(f"forked run exited without result (status {status})")
+        is_success, value = pickle.loads(data)
+        if not is_success:
+            raise ValueError(f"forked run failed: {value}")
+        return value
+
+
+def time_in_forked_child(func: Callable[[], Any]) -> float:
+    """Run func in a forked child process and return its run time."""
+    _, run_time = ForkedRun(func).result()
+    return run_time
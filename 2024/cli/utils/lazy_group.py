@@ -0,0 +1,25 @@
+from importlib import import_module
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that only imports the module of a subcommand when the subcommand is used.
+
+    Subclasses list their commands in lazy_commands as a mapping from command name to the
+    module containing a typer app named 'app' for that command.
+    """
+
+    lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """Return names of both the lazy and the eagerly registered commands."""
+        return [*self.lazy_commands, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | TyperGroup | None:
+        """Import and return the requested command."""
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        module = import_module(self.lazy_commands[cmd_name])
+        return typer.main.get_command(module.app)
@@ -0,0 +1,82 @@
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+class ModuleWatcher:
+    """Track modification times of the modules of a package and reload the changed ones.
+
+    Modules that bind names from a changed module are reloaded as well, after the modules they depend on,
+    so that they pick up the new definitions.
+    """
+
+    package_name: str
+    package_path: Path
+    mtimes: dict[Path, int]
+
+    def __init__(self, package_name: str, package_path: Path):
+        self.package_name = package_name
+        self.package_path = package_path
+        self.mtimes = self._get_mtimes()
+
+    def get_changed_modules(self) -> list[str]:
+        """Return names of the modules whose files changed since the last call."""
+        mtimes = self._get_mtimes()
+        changed_files = [path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime]
+        self.mtimes = mtimes
+        return [self._get_module_name(path) for path in changed_files]
+
+    def reload(self, changed_module_names: list[str]) -> list[str]:
+        """Reload changed modules and the modules depending on them, returning the reloaded module names."""
+        modules = self._get_loaded_modules()
+        dependencies = {name: self._get_dependencies(module, modules) for name, module in modules.items()}
+        to_reload = {name for name in changed_module_names if name in modules}
+        # add modules that depend on a module that is reloaded until nothing changes
+        while True:
+            dependents = {name for name, deps in dependencies.items() if deps & to_reload} - to_reload
+            if not dependents:
+                break
+            to_reload |= dependents
+
+        reloaded: list[str] = []
+        while len(reloaded) < len(to_reload):
+            ready = sorted(
+                name for name in to_reload - set(reloaded) if not (dependencies[name] & to_reload) - set(reloaded)
+            )
+            if not ready:
+                raise ValueError(f"circular imports between {', '.join(sorted(to_reload - set(reloaded)))}")
+            for name in ready:
+                importlib.reload(modules[name])
+                reloaded.append(name)
+        return reloaded
+
+    def _get_mtimes(self) -> dict[Path, int]:
+        """Return modification time of each source file of the package."""
+        return {path: path.stat().st_mtime_ns for path in sorted(self.package_path.rglob("*.py"))}
+
+    def _get_module_name(self, path: Path) -> str:
+        """Return module name of a source file in the package."""
+        parts = path.relative_to(self.package_path).with_suffix("").parts
+        return ".".join([self.package_name, *parts])
+
+    def _get_loaded_modules(self) -> dict[str, ModuleType]:
+        """Return imported modules of the package."""
+        return {
+            name: module
+            for name, module in sys.modules.items()
+            if name.startswith(f"{self.package_name}.") and module is not None
+        }
+
+    @staticmethod
+    def _get_dependencies(module: ModuleType, modules: dict[str, ModuleType]) -> set[str]:
+        """Return names of package modules that module imported or imported names from."""
+        dependencies = set()
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+            if name in modules and name != module.__name__:
+                dependencies.add(name)
+        return dependencies
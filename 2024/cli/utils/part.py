@@ -19,3 +19,21 @@ class PartArg(str, Enum):
                 return Part.A
             case PartArg.B:
                 return Part.B
+
+
+class SolvePartArg(str, Enum):
+    """Argument version of Part for solving, which can also solve both parts at once."""
+
+    A = "a"
+    B = "b"
+    BOTH = "both"
+
+    def to_parts(self) -> list[Part]:
+        """Convert SolvePartArg to the list of parts to solve."""
+        match self:
+            case SolvePartArg.A:
+                return [Part.A]
+            case SolvePartArg.B:
+                return [Part.B]
+            case SolvePartArg.BOTH:
+                return [Part.A, Part.B]
@@ -0,0 +1,116 @@
+import json
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+from cli.utils.profile_results import ProfileResults
+
+# oldest entries are dropped beyond this, apart from the latest baseline
+MAX_ENTRY_COUNT = 100
+
+
+class ProfileHistoryEntry(NamedTuple):
+    revision: str
+    timestamp: str
+    is_baseline: bool
+    results: ProfileResults
+
+    @classmethod
+    def create(cls, results: ProfileResults, revision: str, is_baseline: bool) -> Self:
+        """Create entry for the given results tagged with the git revision they were measured at and the time."""
+        return cls(
+            revision=revision,
+            timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            is_baseline=is_baseline,
+            results=results,
+        )
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create ProfileHistoryEntry from json dict."""
+        return cls(
+            revision=json_dict["revision"],
+            timestamp=json_dict["timestamp"],
+            is_baseline=json_dict["baseline"],
+            results=ProfileResults.from_json_dict(json_dict["results"]),
+        )
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {
+            "revision": self.revision,
+            "timestamp": self.timestamp,
+            "baseline": self.is_baseline,
+            "results": self.results.to_json_dict(),
+        }
+
+
+class ProfileHistory(NamedTuple):
+    entries: list[ProfileHistoryEntry]
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> Self:
+        """Create ProfileHistory from file, or an empty history if the file does not exist."""
+        if not file_path.exists():
+            return cls(entries=[])
+        with file_path.open("r") as file:
+            contents = json.loads(file.read())
+        try:
+            return cls(entries=[ProfileHistoryEntry.from_json_dict(entry) for entry in contents["entries"]])
+        except KeyError:
+            raise ValueError("invalid file format!")
+
+    def to_file(self, file_path: Path) -> None:
+        """Write ProfileHistory to file."""
+        with file_path.open("w") as file:
+            file.write(json.dumps({"entries": [entry.to_json_dict() for entry in self.entries]}))
+
+    def add_entry(self, entry: ProfileHistoryEntry, max_entry_count: int = MAX_ENTRY_COUNT) -> Self:
+        """Return history with the entry appended, dropping the oldest entries beyond max_entry_count.
+
+        The latest baseline is always kept, so that later runs can still be compared against it.
+        """
+        entries = [*self.entries, entry]
+        if len(entries) <= max_entry_count:
+            return type(self)(entries=entries)
+        baseline = type(self)(entries=entries).get_latest_baseline()
+        kept_entries = entries[-max_entry_count:]
+        if baseline is not None and all(kept_entry is not baseline for kept_entry in kept_entries):
+            kept_entries = [baseline, *kept_entries[1:]]
+        return type(self)(entries=kept_entries)
+
+    def get_latest_baseline(self) -> ProfileHistoryEntry | None:
+        """Return the most recently recorded baseline."""
+        for entry in reversed(self.entries):
+            if entry.is_baseline:
+                return entry
+        return None
+
+
+def get_git_revision(repository_path: Path, excluded_patterns: tuple[str, ...] = ()) -> str:
+    """Return short git revision, marked as dirty if there are uncommitted changes.
+
+    Changes to files matching excluded_patterns, such as profiling output, do not count as uncommitted.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repository_path, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            [
+                "git",
+                "status",
+                "--porcelain",
+                "--untracked-files=no",
+                ".",
+                *(f":(exclude,glob)**/{pattern}" for pattern in excluded_patterns),
+            ],
+            cwd=repository_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{revision}-dirty" if status.strip() else revision
@@ -1,4 +1,5 @@
 import json
+import platform
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, NamedTuple, Self
@@ -6,20 +7,145 @@ from typing import Any, NamedTuple, Self
 import numpy as np
 
 from cli.utils.day import Day
+from cli.utils.format_size import format_size
+from cli.utils.format_time import format_time
 from cli.utils.part import Part
 
-_prefix = {
-    "n": 1e-9,  # nano
-    "u": 1e-6,  # micro
-    "m": 1e-3,  # mili
-}
+BOOTSTRAP_SAMPLE_COUNT = 2000
+CONFIDENCE_LEVEL = 0.95
+
+
+class AllocationSite(NamedTuple):
+    location: str
+    size: int
+    count: int
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create AllocationSite from json dict."""
+        return cls(location=json_dict["location"], size=json_dict["size"], count=json_dict["count"])
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {"location": self.location, "size": self.size, "count": self.count}
 
 
 @dataclass
-class PartProfileResults:
-    part: Part
+class MemoryResults:
+    """Memory usage of a single run.
+
+    peak and net are traced by tracemalloc, while max_rss is the high-water mark of the whole process
+    at the end of the run.
+    """
+
+    peak: int
+    net: int
+    max_rss: int
+    top_sites: list[AllocationSite]
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create MemoryResults from json dict."""
+        return cls(
+            peak=json_dict["peak"],
+            net=json_dict["net"],
+            max_rss=json_dict["maxRss"],
+            top_sites=[AllocationSite.from_json_dict(site) for site in json_dict["topSites"]],
+        )
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {
+            "peak": self.peak,
+            "net": self.net,
+            "maxRss": self.max_rss,
+            "topSites": [site.to_json_dict() for site in self.top_sites],
+        }
+
+    def to_table_row(self, name: str) -> tuple[str, ...]:
+        """Return row for rich.Table."""
+        top_sites = "\n".join(f"{site.location} ({format_size(site.size)})" for site in self.top_sites)
+        return (
+            name,
+            format_size(self.peak),
+            format_size(self.net),
+            format_size(self.max_rss),
+            top_sites,
+        )
+
+
+class SectionResults(NamedTuple):
+    name: str
+    call_count: int
+    time: float
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create SectionResults from json dict."""
+        return cls(name=json_dict["name"], call_count=json_dict["callCount"], time=json_dict["time"])
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {"name": self.name, "callCount": self.call_count, "time": self.time}
+
+
+@dataclass
+class InstrumentationResults:
+    """Hot path sections and counters recorded during a single instrumented run.
+
+    The instrumentation adds overhead to every recorded call, so run_time is longer than the timed runs.
+    """
+
+    run_time: float
+    sections: list[SectionResults]
+    counters: dict[str, int]
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create InstrumentationResults from json dict."""
+        return cls(
+            run_time=json_dict["runTime"],
+            sections=[SectionResults.from_json_dict(section) for section in json_dict["sections"]],
+            counters=json_dict["counters"],
+        )
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        return {
+            "runTime": self.run_time,
+            "sections": [section.to_json_dict() for section in self.sections],
+            "counters": self.counters,
+        }
+
+    def to_table_rows(self, name: str) -> list[tuple[str, ...]]:
+        """Return rows for rich.Table, one for each section and counter.
+
+        Throughput of a section is its calls per second spent in it, while throughput of a counter is
+        its count per second of the whole run.
+        """
+        rows = [
+            (
+                name,
+                section.name,
+                f"{section.call_count:,}",
+                format_time(section.time, precision=2),
+                _format_rate(section.call_count, section.time),
+            )
+            for section in self.sections
+        ]
+        rows.extend(
+            (name, counter_name, f"{value:,}", "-", _format_rate(value, self.run_time))
+            for counter_name, value in self.counters.items()
+        )
+        return rows
+
+
+@dataclass
+class TimingResults:
     run_count: int
     times: list[float]
+    warmup_count: int = 0
+    memory: MemoryResults | None = None
 
     @property
     def np_times(self) -> np.ndarray:
@@ -29,78 +155,298 @@ class PartProfileResults:
     @property
     def average(self) -> float:
         """Return average run time."""
+        if not self.times:
+            return 0.0
         return self.np_times.mean()
 
+    @property
+    def median(self) -> float:
+        """Return median run time."""
+        if not self.times:
+            return 0.0
+        return float(np.median(self.np_times))
+
+    @property
+    def stddev(self) -> float:
+        """Return sample standard deviation of the run times."""
+        if len(self.times) < 2:
+            return 0.0
+        return float(self.np_times.std(ddof=1))
+
     @property
     def min(self) -> float:
         """Return min run time."""
+        if not self.times:
+            return 0.0
         return self.np_times.min()
 
     @property
     def max(self) -> float:
         """Return max run time."""
+        if not self.times:
+            return 0.0
         return self.np_times.max()
 
+    @property
+    def p90(self) -> float:
+        """Return 90th percentile run time."""
+        if not self.times:
+            return 0.0
+        return float(np.percentile(self.np_times, 90))
+
+    @property
+    def p99(self) -> float:
+        """Return 99th percentile run time."""
+        if not self.times:
+            return 0.0
+        return float(np.percentile(self.np_times, 99))
+
+    @property
+    def confidence_interval(self) -> tuple[float, float]:
+        """Return bootstrapped confidence interval for the average run time."""
+        if not self.times:
+            return 0.0, 0.0
+        rng = np.random.default_rng(seed=0)
+        resampled_averages = rng.choice(self.np_times, size=(BOOTSTRAP_SAMPLE_COUNT, len(self.times))).mean(axis=1)
+        tail = (1 - CONFIDENCE_LEVEL) / 2 * 100
+        lower, upper = np.percentile(resampled_averages, [tail, 100 - tail])
+        return float(lower), float(upper)
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create TimingResults from json dict."""
+        return cls(
+            run_count=json_dict["runCount"],
+            times=json_dict["times"],
+            warmup_count=json_dict.get("warmupCount", 0),
+            memory=MemoryResults.from_json_dict(json_dict["memory"]) if "memory" in json_dict else None,
+        )
+
     def to_json_dict(self) -> dict[str, Any]:
         """Return json dict."""
-        return {
-            "part": self.part.value,
+        json_dict = {
             "runCount": self.run_count,
+            "warmupCount": self.warmup_count,
             "times": self.times,
+            "mean": float(self.average),
+            "median": self.median,
+            "stddev": self.stddev,
+            "min": float(self.min),
+            "max": float(self.max),
+            "p90": self.p90,
+            "p99": self.p99,
+            "confidenceInterval": list(self.confidence_interval),
         }
+        if self.memory is not None:
+            json_dict["memory"] = self.memory.to_json_dict()
+        return json_dict
 
-    def to_table_row(self) -> tuple[str, str, str, str, str]:
+    def to_table_row(self, name: str) -> tuple[str, ...]:
         """Return row for rich.Table."""
+        lower, upper = self.confidence_interval
+        return (
+            name,
+            str(self.run_count),
+            self.format_time(self.average, precision=2),
+            self.format_time(self.median, precision=2),
+            self.format_time(self.stddev, precision=2),
+            self.format_time(self.min, precision=2),
+            self.format_time(self.max, precision=2),
+            self.format_time(self.p90, precision=2),
+            self.format_time(self.p99, precision=2),
+            f"±{self.format_time((upper - lower) / 2, precision=2)}",
+        )
+
+    def to_summary_table_row(self, name: str) -> tuple[str, ...]:
+        """Return row for rich.Table with the run count, median, min, p90 and confidence interval."""
+        lower, upper = self.confidence_interval
         return (
-            str(self.part),
+            name,
             str(self.run_count),
-            self.format_time(self.average),
-            self.format_time(self.min),
-            self.format_time(self.max),
+            self.format_time(self.median, precision=2),
+            self.format_time(self.min, precision=2),
+            self.format_time(self.p90, precision=2),
+            f"±{self.format_time((upper - lower) / 2, precision=2)}",
         )
 
     @staticmethod
     def format_time(seconds: float, precision: int = 3) -> str:
         """Use suitable SI prefix for time."""
-        if seconds <= _prefix["n"]:
-            nano_seconds = seconds / _prefix["n"]
-            return f"{nano_seconds:.{precision}f} ns"
-        elif seconds <= _prefix["u"]:
-            micro_seconds = seconds / _prefix["u"]
-            return f"{micro_seconds:.{precision}f} μs"
-        elif seconds <= _prefix["m"] * 100:
-            mili_seconds = seconds / _prefix["m"]
-            return f"{mili_seconds:.{precision}f} ms"
-        else:
-            return f"{seconds:.{precision}f} s"
+        return format_time(seconds, precision=precision)
+
+
+@dataclass(kw_only=True)
+class PartProfileResults(TimingResults):
+    part: Part
+    instrumentation: InstrumentationResults | None = None
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create PartProfileResults from json dict."""
+        return cls(
+            part=Part(json_dict["part"]),
+            run_count=json_dict["runCount"],
+            times=json_dict["times"],
+            warmup_count=json_dict.get("warmupCount", 0),
+            memory=MemoryResults.from_json_dict(json_dict["memory"]) if "memory" in json_dict else None,
+            instrumentation=(
+                InstrumentationResults.from_json_dict(json_dict["instrumentation"])
+                if "instrumentation" in json_dict
+                else None
+            ),
+        )
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
+        json_dict = {"part": self.part.value, **super().to_json_dict()}
+        if self.instrumentation is not None:
+            json_dict["instrumentation"] = self.instrumentation.to_json_dict()
+        return json_dict
+
+
+class EnvironmentInfo(NamedTuple):
+    python_version: str
+    numpy_version: str
+    cpu_model: str
+    platform: str
+
+    @classmethod
+    def collect(cls) -> Self:
+        """Collect information about the environment the profiling is run in."""
+        return cls(
+            python_version=platform.python_version(),
+            numpy_version=np.__version__,
+            cpu_model=_get_cpu_model(),
+            platform=platform.platform(),
+        )
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, str]) -> Self:
+        """Create EnvironmentInfo from json dict."""
+        return cls(
+            python_version=json_dict["python"],
+            numpy_version=json_dict["numpy"],
+            cpu_model=json_dict["cpu"],
+            platform=json_dict["platform"],
+        )
+
+    def to_json_dict(self) -> dict[str, str]:
+        """Return json dict."""
+        return {
+            "python": self.python_version,
+            "numpy": self.numpy_version,
+            "cpu": self.cpu_model,
+            "platform": self.platform,
+        }
 
 
 class ProfileResults(NamedTuple):
     day: Day
     a: PartProfileResults
     b: PartProfileResults
+    import_results: TimingResults | None = None
+    parse_results: TimingResults | None = None
+    environment: EnvironmentInfo | None = None
 
     @classmethod
     def from_file(cls, file_path: Path) -> Self:
         """Create ProfileResults from file."""
         with file_path.open("r") as file:
             contents = json.loads(file.read())
+        return cls.from_json_dict(contents)
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create ProfileResults from json dict."""
         try:
-            a_dict = contents["a"]
-            b_dict = contents["b"]
+            # phase timings and environment info are missing from files written by older versions
             return cls(
-                day=contents["day"],
-                a=PartProfileResults(part=Part(a_dict["part"]), run_count=a_dict["runCount"], times=a_dict["times"]),
-                b=PartProfileResults(part=Part(b_dict["part"]), run_count=b_dict["runCount"], times=b_dict["times"]),
+                day=json_dict["day"],
+                a=PartProfileResults.from_json_dict(json_dict["a"]),
+                b=PartProfileResults.from_json_dict(json_dict["b"]),
+                import_results=TimingResults.from_json_dict(json_dict["import"]) if "import" in json_dict else None,
+                parse_results=TimingResults.from_json_dict(json_dict["parse"]) if "parse" in json_dict else None,
+                environment=(
+                    EnvironmentInfo.from_json_dict(json_dict["environment"]) if "environment" in json_dict else None
+                ),
             )
         except KeyError:
             raise ValueError("invalid file format!")
 
-    def to_json(self) -> str:
-        """Convert ProfileResults to json string."""
+    def to_json_dict(self) -> dict[str, Any]:
+        """Return json dict."""
         out = {
             "day": self.day,
             "a": self.a.to_json_dict(),
             "b": self.b.to_json_dict(),
         }
-        return json.dumps(out)
+        if self.import_results is not None:
+            out["import"] = self.import_results.to_json_dict()
+        if self.parse_results is not None:
+            out["parse"] = self.parse_results.to_json_dict()
+        if self.environment is not None:
+            out["environment"] = self.environment.to_json_dict()
+        return out
+
+    def to_json(self) -> str:
+        """Convert ProfileResults to json string."""
+        return json.dumps(self.to_json_dict())
+
+    def get_phases(self) -> dict[str, TimingResults]:
+        """Return timing results of each profiled phase by name."""
+        phases = {}
+        if self.import_results is not None:
+            phases["import"] = self.import_results
+        if self.parse_results is not None:
+            phases["parse"] = self.parse_results
+        phases[str(self.a.part)] = self.a
+        phases[str(self.b.part)] = self.b
+        return phases
+
+    def to_table_rows(self) -> list[tuple[str, ...]]:
+        """Return rows for rich.Table, one for each profiled phase."""
+        return [timing_results.to_table_row(name) for name, timing_results in self.get_phases().items()]
+
+    def to_summary_table_rows(self) -> list[tuple[str, ...]]:
+        """Return summary rows for rich.Table, one for each profiled phase."""
+        return [timing_results.to_summary_table_row(name) for name, timing_results in self.get_phases().items()]
+
+    def to_memory_table_rows(self) -> list[tuple[str, ...]]:
+        """Return rows for rich.Table, one for each phase with memory results."""
+        rows = []
+        if self.parse_results is not None and self.parse_results.memory is not None:
+            rows.append(self.parse_results.memory.to_table_row("parse"))
+        if self.a.memory is not None:
+            rows.append(self.a.memory.to_table_row(str(self.a.part)))
+        if self.b.memory is not None:
+            rows.append(self.b.memory.to_table_row(str(self.b.part)))
+        return rows
+
+    def to_instrumentation_table_rows(self) -> list[tuple[str, ...]]:
+        """Return rows for rich.Table, one for each section and counter of the parts with instrumentation results."""
+        rows = []
+        for part_results in (self.a, self.b):
+            if part_results.instrumentation is not None:
+                rows.extend(part_results.instrumentation.to_table_rows(str(part_results.part)))
+        return rows
+
+
+def _format_rate(value: int, seconds: float) -> str:
+    """Return value per second with a suitable SI prefix."""
+    if seconds <= 0:
+        return "-"
+    rate = value / seconds
+    for prefix, factor in (("P", 1e15), ("T", 1e12), ("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if rate >= factor:
+            return f"{rate / factor:.2f} {prefix}/s"
+    return f"{rate:.2f} /s"
+
+
+def _get_cpu_model() -> str:
+    """Return CPU model name."""
+    cpu_info_path = Path("/proc/cpuinfo")
+    if cpu_info_path.exists():
+        for line in cpu_info_path.read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", maxsplit=1)[1].strip()
+    return platform.processor() or platform.machine()
@@ -0,0 +1,89 @@
+import math
+from typing import NamedTuple, Self
+
+from cli.utils.day import Day
+from cli.utils.profile_results import ProfileResults
+
+MIN_RUN_COUNT = 3
+MAX_RUN_COUNT = 100
+# relative spread assumed for phases with too few recorded runs to estimate it
+DEFAULT_COEFFICIENT_OF_VARIATION = 0.1
+Z_SCORE_95 = 1.96
+
+
+class DayEstimate(NamedTuple):
+    """Expected cost of profiling a day, estimated from its previous profiling results."""
+
+    day: Day
+    run_time: float | None
+    coefficient_of_variation: float
+
+    @classmethod
+    def from_results(cls, day: Day, results: ProfileResults | None) -> Self:
+        """Create DayEstimate from previous results, which may be missing."""
+        if results is None:
+            return cls(day=day, run_time=None, coefficient_of_variation=DEFAULT_COEFFICIENT_OF_VARIATION)
+        phases = results.get_phases().values()
+        coefficients_of_variation = [
+            phase.stddev / phase.average
+            if len(phase.times) >= 2 and phase.average > 0
+            else DEFAULT_COEFFICIENT_OF_VARIATION
+            for phase in phases
+        ]
+        return cls(
+            day=day,
+            run_time=sum(phase.median for phase in phases),
+            coefficient_of_variation=max(coefficients_of_variation),
+        )
+
+    def get_required_run_count(self, precision: float) -> int:
+        """Return number of runs for the 95% confidence interval of the mean to be within ±precision of it."""
+        run_count = math.ceil((Z_SCORE_95 * self.coefficient_of_variation / precision) ** 2)
+        return min(max(run_count, MIN_RUN_COUNT), MAX_RUN_COUNT)
+
+
+class ScheduledDay(NamedTuple):
+    day: Day
+    run_count: int
+    warmup_count: int
+    expected_time: float | None
+
+
+def schedule_days(
+    estimates: list[DayEstimate], budget: float, worker_count: int, precision: float, warmup_count: int
+) -> list[ScheduledDay]:
+    """Return run counts for each day, longest expected days first.
+
+    Each day gets the runs needed for the requested precision if they fit into the budget on worker_count
+    workers. Otherwise the time is shared out starting with the cheapest days, so that cheap days still
+    get all their runs while expensive days get an equal share of what is left, but at least one run.
+    Days whose runs alone take longer than the budget skip the warmup runs. Days without previous results
+    get MIN_RUN_COUNT runs and are scheduled first, since they may be long.
+    """
+    scheduled_days = [
+        ScheduledDay(day=estimate.day, run_count=MIN_RUN_COUNT, warmup_count=warmup_count, expected_time=None)
+        for estimate in estimates
+        if estimate.run_time is None
+    ]
+    known_estimates = sorted(
+        (estimate for estimate in estimates if estimate.run_time is not None),
+        key=lambda estimate: estimate.get_required_run_count(precision) * estimate.run_time,
+    )
+    remaining_time = budget * worker_count
+    for i, estimate in enumerate(known_estimates):
+        run_time = estimate.run_time
+        if run_time is None:
+            continue
+        share = remaining_time / (len(known_estimates) - i)
+        max_run_count = math.floor(share / run_time) - warmup_count if run_time > 0 else MAX_RUN_COUNT
+        run_count = max(1, min(estimate.get_required_run_count(precision), max_run_count))
+        day_warmup_count = warmup_count if (run_count + warmup_count) * run_time <= budget else 0
+        expected_time = (run_count + day_warmup_count) * run_time
+        remaining_time = max(remaining_time - expected_time, 0.0)
+        scheduled_days.append(
+            ScheduledDay(
+                day=estimate.day, run_count=run_count, warmup_count=day_warmup_count, expected_time=expected_time
+            )
+        )
+    # longest processing time first keeps the last worker from finishing long after the others
+    return sorted(scheduled_days, key=lambda d: math.inf if d.expected_time is None else d.expected_time, reverse=True)
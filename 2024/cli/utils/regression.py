@@ -0,0 +1,97 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from cli.utils.format_time import format_time
+from cli.utils.profile_results import TimingResults
+
+
+class PhaseComparison(NamedTuple):
+    name: str
+    baseline_median: float
+    current_median: float
+    slower_p_value: float
+    faster_p_value: float
+    threshold: float
+    significance: float
+
+    @property
+    def relative_change(self) -> float:
+        """Return relative change in median time from the baseline."""
+        return self.current_median / self.baseline_median - 1
+
+    @property
+    def is_regression(self) -> bool:
+        """Return True if the phase got significantly slower by more than the threshold."""
+        return self.slower_p_value < self.significance and self.relative_change > self.threshold
+
+    @property
+    def is_improvement(self) -> bool:
+        """Return True if the phase got significantly faster by more than the threshold."""
+        return self.faster_p_value < self.significance and self.relative_change < -self.threshold
+
+    def to_table_row(self) -> tuple[str, str, str, str, str, str]:
+        """Return row for rich.Table."""
+        if self.is_regression:
+            verdict = "[red]regressed[/red]"
+        elif self.is_improvement:
+            verdict = "[green]improved[/green]"
+        else:
+            verdict = "unchanged"
+        return (
+            self.name,
+            format_time(self.baseline_median),
+            format_time(self.current_median),
+            f"{self.relative_change:+.1%}",
+            f"{min(self.slower_p_value, self.faster_p_value):.3g}",
+            verdict,
+        )
+
+
+def compare_timings(
+    name: str, baseline: TimingResults, current: TimingResults, threshold: float, significance: float
+) -> PhaseComparison:
+    """Compare timings of a phase against the baseline using a Mann-Whitney U test."""
+    slower_p_value, faster_p_value = mann_whitney_u_p_values(current.np_times, baseline.np_times)
+    return PhaseComparison(
+        name=name,
+        baseline_median=baseline.median,
+        current_median=current.median,
+        slower_p_value=slower_p_value,
+        faster_p_value=faster_p_value,
+        threshold=threshold,
+        significance=significance,
+    )
+
+
+def mann_whitney_u_p_values(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """Return one-sided p-values for x being stochastically greater and less than y.
+
+    Uses the normal approximation with tie and continuity correction.
+    """
+    x_count, y_count = x.size, y.size
+    total_count = x_count + y_count
+    if x_count == 0 or y_count == 0:
+        return 1.0, 1.0
+
+    # average ranks of tied values
+    _, inverse, tie_counts = np.unique(np.concatenate((x, y)), return_inverse=True, return_counts=True)
+    ranks = (np.cumsum(tie_counts) - (tie_counts - 1) / 2)[inverse]
+    u = ranks[:x_count].sum() - x_count * (x_count + 1) / 2
+
+    mean = x_count * y_count / 2
+    tie_correction = (tie_counts**3 - tie_counts).sum() / (total_count * (total_count - 1))
+    variance = x_count * y_count / 12 * ((total_count + 1) - tie_correction)
+    if variance <= 0:
+        return 1.0, 1.0
+    std = math.sqrt(variance)
+
+    greater_z = (u - mean - 0.5) / std
+    less_z = (mean - u - 0.5) / std
+    return _normal_survival(greater_z), _normal_survival(less_z)
+
+
+def _normal_survival(z: float) -> float:
+    """Return P(Z > z) for a standard normal Z."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
@@ -0,0 +1,23 @@
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+# only the standard library is imported here, so that the thin client starts quickly
+SOCKET_PATH = Path(".cache/serve.sock")
+BUFFER_SIZE = 2**16
+
+
+def send_request(socket_path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    """Send request to the serve daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise ValueError(f"no server listening on '{socket_path}', start one with 'main.py serve'") from None
+        client.sendall(json.dumps(request).encode() + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        data = b""
+        while chunk := client.recv(BUFFER_SIZE):
+            data += chunk
+    return json.loads(data)
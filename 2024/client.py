@@ -0,0 +1,62 @@
+"""Thin client for the 'main.py serve' daemon.
+
+Only the standard library is imported, so a request costs little more than the interpreter startup.
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+from cli.utils.format_time import format_time
+from cli.utils.serve_client import SOCKET_PATH, send_request
+
+PARTS = {"a": 1, "b": 2}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Send requests to a running 'main.py serve'.")
+    parser.add_argument("--socket", type=Path, default=Path(__file__).parent / SOCKET_PATH, help="path of the socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ["solve", "profile"]:
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("day", type=int, choices=range(1, 26), metavar="day")
+        subparser.add_argument("part", choices=PARTS)
+        subparser.add_argument("--input-file", "-i", default="input.txt", help="filename of file to read input from")
+        if command == "profile":
+            subparser.add_argument("--run-count", type=int, default=10, help="number of times to run code")
+    subparsers.add_parser("stop")
+    args = parser.parse_args()
+
+    request = {"command": args.command}
+    if args.command != "stop":
+        request.update(day=args.day, part=PARTS[args.part], inputFile=args.input_file)
+    if args.command == "profile":
+        request.update(runCount=args.run_count)
+
+    try:
+        response = send_request(args.socket, request)
+    except ValueError as e:
+        print(f"failed to {args.command}: {e}")
+        return 1
+    if "error" in response:
+        print(f"failed to {args.command}: {response['error']}")
+        return 1
+
+    match args.command:
+        case "solve":
+            print(f"solution: {response['answer']}")
+            print(f"solved in {format_time(response['elapsedTime'])} ({response['status']})")
+        case "profile":
+            times = response["times"]
+            print(
+                f"day {args.day}, part {args.part}: median {format_time(statistics.median(times))}, "
+                f"min {format_time(min(times))} over {len(times)} runs ({response['status']})"
+            )
+        case "stop":
+            print("server stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+import numpy as np
+
+BASE_LINE_COUNT = 1000
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate input with scale times as many location id pairs as the real input."""
+    rng = np.random.default_rng(seed)
+    line_count = max(1, round(BASE_LINE_COUNT * scale))
+    left = rng.integers(10000, 100000, size=line_count)
+    # reuse some of the left ids so that the similarity score is non-trivial
+    right = np.where(rng.random(line_count) < 0.5, rng.choice(left, size=line_count), left[::-1])
+    return "".join(f"{a}   {b}\n" for a, b in zip(left, right))
@@ -1,28 +1,129 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
+
 import numpy as np
 
+from utilities.external_sort import iter_value_counts, merge_sorted_runs, write_sorted_run
 from utilities.solution_abstract import SolutionAbstract
 
+# inputs larger than this are solved out-of-core instead of being parsed into memory
+OUT_OF_CORE_FILE_SIZE = 2**30
+CHUNK_SIZE = 2**26
+
 
 class Solution(SolutionAbstract):
-    data: np.ndarray
+    data: np.ndarray | None
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        self.data = np.loadtxt(self.raw_data, dtype=np.int32)
+        """Parse input from self.input_bytes, or leave it in the file if it is too large."""
+        if self.is_out_of_core():
+            self.data = None
+            return
+        chunks = list(self._iter_chunks())
+        self.data = np.concatenate(chunks) if chunks else np.zeros((0, 2), dtype=np.int64)
+
+    def is_out_of_core(self) -> bool:
+        """Return True if the input is too large to be held in memory."""
+        threshold = int(os.environ.get("AOC_OUT_OF_CORE_FILE_SIZE", OUT_OF_CORE_FILE_SIZE))
+        return len(self.input_bytes) > threshold
 
     def part_a(self) -> int:
         """Solve part a."""
+        if self.data is None:
+            return self._part_a_out_of_core()
         sorted_a = np.sort(self.data[:, 0])
         sorted_b = np.sort(self.data[:, 1])
         differences = np.abs(sorted_a - sorted_b)
-        return np.sum(differences)
+        return int(np.sum(differences))
 
     def part_b(self) -> int:
         """Solve part b."""
+        if self.data is None:
+            return self._part_b_out_of_core()
         unique, counts = np.unique(self.data[:, 1], return_counts=True)
-        table = dict(zip(unique, counts))
-        similarity_score = 0
-        for loc_id in self.data[:, 0]:
-            if loc_id in table:
-                similarity_score += table[loc_id] * loc_id
+        return _get_similarity_score(self.data[:, 0], np.ones_like(self.data[:, 0]), unique, counts)
+
+    def _part_a_out_of_core(self) -> int:
+        """Solve part a by merging sorted runs of both columns written to disk."""
+        with TemporaryDirectory() as run_dir:
+            sorted_a, sorted_b = self._sort_columns(Path(run_dir))
+            total_distance = 0
+            buffer_a = buffer_b = np.zeros(0, dtype=np.int64)
+            while True:
+                if buffer_a.size == 0:
+                    buffer_a = next(sorted_a, buffer_a)
+                if buffer_b.size == 0:
+                    buffer_b = next(sorted_b, buffer_b)
+                count = min(buffer_a.size, buffer_b.size)
+                if count == 0:
+                    break
+                total_distance += int(np.abs(buffer_a[:count] - buffer_b[:count]).sum())
+                buffer_a, buffer_b = buffer_a[count:], buffer_b[count:]
+        return total_distance
+
+    def _part_b_out_of_core(self) -> int:
+        """Solve part b by joining the value counts of both sorted columns as they stream from disk."""
+        with TemporaryDirectory() as run_dir:
+            sorted_a, sorted_b = self._sort_columns(Path(run_dir))
+            counts_a = iter_value_counts(sorted_a)
+            counts_b = iter_value_counts(sorted_b)
+            similarity_score = 0
+            empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+            values_a, count_a = values_b, count_b = empty
+            while True:
+                if values_a.size == 0:
+                    values_a, count_a = next(counts_a, empty)
+                if values_b.size == 0:
+                    values_b, count_b = next(counts_b, empty)
+                if values_a.size == 0 or values_b.size == 0:
+                    break
+                # values up to the smaller of the last values are complete in both buffers
+                bound = min(values_a[-1], values_b[-1])
+                end_a = int(np.searchsorted(values_a, bound, side="right"))
+                end_b = int(np.searchsorted(values_b, bound, side="right"))
+                similarity_score += _get_similarity_score(
+                    values_a[:end_a], count_a[:end_a], values_b[:end_b], count_b[:end_b]
+                )
+                values_a, count_a = values_a[end_a:], count_a[end_a:]
+                values_b, count_b = values_b[end_b:], count_b[end_b:]
         return similarity_score
+
+    def _sort_columns(self, run_dir: Path) -> tuple[Iterator[np.ndarray], Iterator[np.ndarray]]:
+        """Write sorted runs of both columns to run_dir and return iterators over their sorted blocks."""
+        run_paths_a = []
+        run_paths_b = []
+        for i, chunk in enumerate(self._iter_chunks()):
+            run_paths_a.append(write_sorted_run(chunk[:, 0], run_dir / f"a_{i}.npy"))
+            run_paths_b.append(write_sorted_run(chunk[:, 1], run_dir / f"b_{i}.npy"))
+        return merge_sorted_runs(run_paths_a), merge_sorted_runs(run_paths_b)
+
+    def _iter_chunks(self) -> Iterator[np.ndarray]:
+        """Yield Nx2 arrays of location id pairs, parsed from blocks of about CHUNK_SIZE bytes of the input."""
+        input_bytes = self.input_bytes
+        start = 0
+        while start < len(input_bytes):
+            end = min(start + CHUNK_SIZE, len(input_bytes))
+            block = bytes(input_bytes[start:end])
+            if end < len(input_bytes):
+                # only parse whole lines, the rest is parsed with the next block
+                block = block[: block.rfind(b"\n") + 1]
+                if not block:
+                    raise ValueError(f"line longer than {CHUNK_SIZE} bytes at offset {start}")
+            start += len(block)
+            yield np.fromstring(block, dtype=np.int64, sep=" ").reshape(-1, 2)
+
+
+def _get_similarity_score(
+    left_values: np.ndarray, left_counts: np.ndarray, right_values: np.ndarray, right_counts: np.ndarray
+) -> int:
+    """Return sum of each left value times its count on the left and on the right.
+
+    right_values has to be sorted and unique, so that the matching right value can be found by binary search.
+    """
+    if right_values.size == 0:
+        return 0
+    positions = np.minimum(np.searchsorted(right_values, left_values), right_values.size - 1)
+    is_match = right_values[positions] == left_values
+    return int(np.sum(left_values[is_match] * left_counts[is_match] * right_counts[positions[is_match]]))
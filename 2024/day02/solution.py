@@ -7,9 +7,9 @@ class Solution(SolutionAbstract):
     reports: list[np.ndarray]
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
+        """Parse input from self.iter_lines()."""
         reports = []
-        for x in self.raw_data:
+        for x in self.iter_lines():
             reports.append(np.array(x.split(" "), dtype=np.int32))
         self.reports = reports
 
@@ -1,3 +1,5 @@
+from itertools import takewhile
+
 from utilities.solution_abstract import SolutionAbstract
 
 
@@ -6,9 +8,10 @@ class Solution(SolutionAbstract):
     update_page_numbers: list[list[int]]
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        break_index = self.raw_data.index("")
-        page_ordering_rules = [(int(p.split("|")[0]), int(p.split("|")[1])) for p in self.raw_data[:break_index]]
+        """Parse input from self.iter_lines()."""
+        lines = self.iter_lines()
+        # rules are followed by a blank line, which is consumed by takewhile
+        page_ordering_rules = [(int(p.split("|")[0]), int(p.split("|")[1])) for p in takewhile(bool, lines)]
         comes_before = {}
         for before_page, after_page in page_ordering_rules:
             if before_page not in comes_before:
@@ -16,7 +19,7 @@ class Solution(SolutionAbstract):
             else:
                 comes_before[before_page].add(after_page)
         self.comes_before = {k: comes_before[k] for k in sorted(comes_before)}
-        self.update_page_numbers = [list(map(int, line.split(","))) for line in self.raw_data[break_index + 1 :]]
+        self.update_page_numbers = [list(map(int, line.split(","))) for line in lines]
 
     def part_a(self) -> int:
         """Solve part a."""
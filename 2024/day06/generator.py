@@ -0,0 +1,47 @@
+import numpy as np
+
+from day06.utils.direction import Direction
+from utilities.input_generator import get_grid_side, grid_to_text
+
+BASE_SIDE = 130
+OBSTACLE_DENSITY = 0.05
+STEPS = {Direction.NORTH: (-1, 0), Direction.EAST: (0, 1), Direction.SOUTH: (1, 0), Direction.WEST: (0, -1)}
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate map with scale times as many cells as the real input.
+
+    Maps where the guard walks in a loop are invalid input, so maps are regenerated until the guard leaves.
+    """
+    rng = np.random.default_rng(seed)
+    side = get_grid_side(BASE_SIDE, scale)
+    while True:
+        is_obstacle = rng.random((side, side)) < OBSTACLE_DENSITY
+        # start in the middle of the map to get paths of similar length as the real input
+        start = tuple(int(i) for i in rng.integers(side // 4, side - side // 4, size=2))
+        is_obstacle[start] = False
+        if _is_leaving_map(is_obstacle, start):
+            break
+
+    grid = np.where(is_obstacle, "#", ".")
+    grid[start] = Direction.NORTH.get_symbol()
+    return grid_to_text(grid)
+
+
+def _is_leaving_map(is_obstacle: np.ndarray, start: tuple[int, int]) -> bool:
+    """Return True if a guard starting at start facing north leaves the map."""
+    height, width = is_obstacle.shape
+    row, col = start
+    direction = Direction.NORTH
+    visited = set()
+    while (row, col, direction) not in visited:
+        visited.add((row, col, direction))
+        row_step, col_step = STEPS[direction]
+        next_row, next_col = row + row_step, col + col_step
+        if not (0 <= next_row < height and 0 <= next_col < width):
+            return True
+        if is_obstacle[next_row, next_col]:
+            direction = direction.next()
+        else:
+            row, col = next_row, next_col
+    return False
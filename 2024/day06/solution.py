@@ -15,19 +15,14 @@ class Solution(SolutionAbstract):
     guard_start: Guard
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        map_l = []
-        direction_symbols = {d.get_symbol() for d in Direction}
-        for i, row in enumerate(self.raw_data):
-            row_list = [c for c in row]
-            direction_symbol_in_row = set(row_list).intersection(direction_symbols)
-            if len(direction_symbol_in_row) == 1:
-                guard_start_direction = direction_from_symbol(direction_symbol_in_row.pop())
-                self.guard_start = Guard(
-                    position=(i, row_list.index(guard_start_direction.get_symbol())), direction=guard_start_direction
-                )
-            map_l.append(row_list)
-        self.map = GuardMap.create(map_l)
+        """Parse input from self.input_bytes."""
+        self.map = GuardMap.create(self.input_bytes)
+        direction_codes = [ord(d.get_symbol()) for d in Direction]
+        guard_indices = self.map.get_indices(np.isin(self.map.values, direction_codes))
+        if len(guard_indices) != 1:
+            raise ValueError(f"expected a single guard, found {len(guard_indices)}")
+        i, j = map(int, guard_indices[0])
+        self.guard_start = Guard(position=(i, j), direction=direction_from_symbol(chr(self.map.values[i, j])))
 
     def get_guard_path(self) -> dict[Guard, bool]:
         """Return dictionary of guard positions."""
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from day06.utils.guard import Guard, step_guard
+from utilities.instrumentation import hot_path
 from utilities.map_base import Map2DBase
 
 
@@ -11,13 +12,12 @@ class GuardMap(Map2DBase):
     is_obstacle: np.ndarray
 
     @classmethod
-    def create(cls, map_list: list[list[str]]):
-        """Create a Map instance from a list of lists."""
-        map_base = Map2DBase.from_list(map_list)
-        is_obstacle = np.zeros(map_base.shape, dtype=bool)
-        is_obstacle[map_base.values == "#"] = True
-        return cls(values=map_base.values, is_obstacle=is_obstacle)
+    def create(cls, input_data: bytes | memoryview):
+        """Create a Map instance from the raw input."""
+        map_base = Map2DBase.from_bytes(input_data)
+        return cls(values=map_base.values, is_obstacle=map_base.values == ord("#"))
 
+    @hot_path("guard_steps")
     def move_guard(self, guard: Guard) -> tuple[Guard, bool]:
         """Move guard a step.
 
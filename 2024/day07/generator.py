@@ -0,0 +1,33 @@
+import numpy as np
+
+BASE_EQUATION_COUNT = 850
+# distribution of the number of components in the real input
+COMPONENT_COUNTS = np.arange(3, 13)
+COMPONENT_COUNT_WEIGHTS = np.array([26, 23, 218, 116, 105, 86, 84, 65, 73, 54])
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate input with scale times as many equations as the real input.
+
+    Roughly half of the equations are solvable, using the same mix of operators as the real input.
+    """
+    rng = np.random.default_rng(seed)
+    equation_count = max(1, round(BASE_EQUATION_COUNT * scale))
+    lines = []
+    for _ in range(equation_count):
+        component_count = rng.choice(COMPONENT_COUNTS, p=COMPONENT_COUNT_WEIGHTS / COMPONENT_COUNT_WEIGHTS.sum())
+        components = [int(x) for x in rng.integers(1, 100, size=component_count)]
+        result = components[0]
+        for component in components[1:]:
+            match rng.integers(3):
+                case 0:
+                    result += component
+                case 1:
+                    result *= component
+                case _:
+                    result = int(f"{result}{component}")
+        if rng.random() < 0.5:
+            # most likely unsolvable
+            result += 1
+        lines.append(f"{result}: {' '.join(map(str, components))}\n")
+    return "".join(lines)
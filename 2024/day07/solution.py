@@ -3,6 +3,7 @@ from typing import NamedTuple
 
 from rich.progress import track
 
+from utilities.instrumentation import hot_path
 from utilities.solution_abstract import SolutionAbstract
 
 
@@ -30,6 +31,7 @@ class Equation(NamedTuple):
     def component_count(self) -> int:
         return len(self.components)
 
+    @hot_path("is_possible")
     def is_possible(self, operations: list[Operation]) -> bool:
         """Recursive function to check if it is possible to obtain result."""
         if self.component_count == 2:
@@ -59,9 +61,9 @@ class Solution(SolutionAbstract):
     equations: list[Equation]
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
+        """Parse input from self.iter_lines()."""
         self.equations = []
-        for row in self.raw_data:
+        for row in self.iter_lines():
             res, comp = row.split(":")
             components = [int(x) for x in comp.strip().split(" ")]
             self.equations.append(Equation(result=int(res), components=components))
@@ -1,33 +1,31 @@
 import numpy as np
 
 from day08.utils.antenna_map import AntennaMap
+from utilities.bitboard import Bitboard
 from utilities.solution_abstract import SolutionAbstract
 
 
 class Solution(SolutionAbstract):
-    frequencies: set[str]
+    frequencies: set[int]
     map: AntennaMap
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        self.frequencies = set()
-        map_l = []
-        for row in self.raw_data:
-            self.frequencies = self.frequencies.union(set(row).difference({"."}))
-            map_l.append([c for c in row])
-        self.map = AntennaMap.from_list(map_l)
+        """Parse input from self.input_bytes."""
+        self.map = AntennaMap.from_bytes(self.input_bytes)
+        # frequencies are the character codes of the antennas
+        self.frequencies = set(np.unique(self.map.values).tolist()).difference({ord(".")})
 
     def part_a(self) -> int:
         """Solve part a."""
         # note: all antenna pairs create antinodes!
-        has_antinode = np.zeros((self.map.shape), dtype=bool)
+        has_antinode = Bitboard.empty(self.map.shape)
         for frequency in list(self.frequencies):
-            has_antinode += self.map.get_antinode_mask_array(frequency)
-        return has_antinode.sum()
+            has_antinode |= Bitboard.from_indices(self.map.get_antinode_indices(frequency), self.map.shape)
+        return has_antinode.popcount()
 
     def part_b(self) -> int:
         """Solve part b."""
-        has_antinode = np.zeros((self.map.shape), dtype=bool)
+        has_antinode = Bitboard.empty(self.map.shape)
         for frequency in list(self.frequencies):
-            has_antinode += self.map.get_resonant_antinode_mask_array(frequency)
-        return has_antinode.sum()
+            has_antinode |= Bitboard.from_indices(self.map.get_resonant_antinode_indices(frequency), self.map.shape)
+        return has_antinode.popcount()
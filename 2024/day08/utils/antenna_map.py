@@ -7,7 +7,7 @@ from utilities.map_base import Map2DBase
 
 @dataclass
 class AntennaMap(Map2DBase):
-    def antenna_indices(self, frequency: str) -> np.ndarray:
+    def antenna_indices(self, frequency: int) -> np.ndarray:
         """Return indices of the antennas with a given frequency."""
         return np.stack(np.where(self.values == frequency), axis=1)
 
@@ -25,12 +25,12 @@ class AntennaMap(Map2DBase):
 
         return all_antinode_indices
 
-    def get_antinode_mask_array(self, frequency: str) -> np.ndarray:
-        """Return boolean mask of where the given frequency creates antinodes."""
+    def get_antinode_indices(self, frequency: int) -> np.ndarray:
+        """Return Nx2 array of positions where the given frequency creates antinodes, possibly repeated."""
         all_antenna_indices = self.antenna_indices(frequency)
         antenna_count = all_antenna_indices.shape[0]
 
-        has_antinode = np.zeros(self.shape, dtype=bool)
+        antinodes = [np.zeros((0, 2), dtype=np.int32)]
         for i in range(antenna_count - 1):
             antenna_pairs = np.stack(
                 (
@@ -43,16 +43,16 @@ class AntennaMap(Map2DBase):
             new_antinode_indices = self.get_all_antinode_indices(antenna_pairs)
             allowed_antinode_indices = np.apply_along_axis(self.filter_antinodes, axis=1, arr=new_antinode_indices)
             allowed_antinodes = new_antinode_indices[allowed_antinode_indices]
-            has_antinode[allowed_antinodes[:, 0], allowed_antinodes[:, 1]] = True
+            antinodes.append(allowed_antinodes)
 
-        return has_antinode
+        return np.concatenate(antinodes)
 
-    def get_resonant_antinode_mask_array(self, frequency: str) -> np.ndarray:
-        """Return boolean mask of where the given frequency creates antinodes."""
+    def get_resonant_antinode_indices(self, frequency: int) -> np.ndarray:
+        """Return Nx2 array of positions where the given frequency creates resonant antinodes, possibly repeated."""
         all_antenna_indices = self.antenna_indices(frequency)
         antenna_count = all_antenna_indices.shape[0]
 
-        has_antinode = np.zeros(self.shape, dtype=bool)
+        antinodes = [np.zeros((0, 2), dtype=np.int32)]
         for i in range(antenna_count - 1):
             antenna_pairs = np.stack(
                 (
@@ -70,7 +70,7 @@ class AntennaMap(Map2DBase):
                     break
 
                 allowed_antinodes = new_antinode_indices[allowed_antinode_indices]
-                has_antinode[allowed_antinodes[:, 0], allowed_antinodes[:, 1]] = True
+                antinodes.append(allowed_antinodes)
                 n += 1
 
-        return has_antinode
+        return np.concatenate(antinodes)
@@ -0,0 +1,14 @@
+import numpy as np
+
+BASE_LENGTH = 20000
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate a disk map scale times as long as the real input."""
+    rng = np.random.default_rng(seed)
+    # the disk map starts and ends with a file
+    length = max(1, round(BASE_LENGTH * scale)) | 1
+    digits = rng.integers(0, 10, size=length)
+    # files always take up at least one block
+    digits[::2] = rng.integers(1, 10, size=digits[::2].size)
+    return "".join(map(str, digits)) + "\n"
@@ -10,19 +10,16 @@ class Solution(SolutionAbstract):
     disk_map: DiskMap
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
+        """Parse input from self.input_array."""
         # odd ints are file size, even are free space
-        values = []
-        current_file_id = 0
-        for i, x in enumerate(self.raw_data[0]):
-            if i % 2 == 0:
-                # file
-                values += list((current_file_id,) * int(x))
-                current_file_id += 1
-            else:
-                # space
-                values += list((-1,) * int(x))
-        self.disk_map = DiskMap(np.stack((np.arange(len(values)), values), axis=-1).astype(np.int32))
+        block_sizes = self.input_array.astype(np.int32) - ord("0")
+        # drop line endings
+        block_sizes = block_sizes[(block_sizes >= 0) & (block_sizes <= 9)]
+        block_ids = np.arange(block_sizes.size, dtype=np.int32)
+        # files get their id (index // 2) and spaces get -1
+        block_values = np.where(block_ids % 2 == 0, block_ids // 2, -1)
+        values = np.repeat(block_values, block_sizes)
+        self.disk_map = DiskMap(np.stack((np.arange(values.size), values), axis=-1).astype(np.int32))
 
     def part_a(self) -> int:
         """Solve part a."""
@@ -59,14 +56,11 @@ class Solution(SolutionAbstract):
                 self.disk_map.switch_value(current_file_indices[0], space_indices[0])
                 continue
 
-            for i, chunk in enumerate(rolling_window(free_space_mask[:max_free_index], size=current_file_size)):
-                if not chunk[0]:
-                    continue
-                if not chunk.all():
-                    continue
-                free_space_start_index = i
-                new_indices = np.arange(start=free_space_start_index, stop=free_space_start_index + current_file_size)
-                self.disk_map.switch_values(current_file_indices, new_indices)
-                break
+            is_free_chunk = rolling_window(free_space_mask[:max_free_index], size=current_file_size).all(axis=-1)
+            if not is_free_chunk.any():
+                continue
+            free_space_start_index = int(is_free_chunk.argmax())
+            new_indices = np.arange(start=free_space_start_index, stop=free_space_start_index + current_file_size)
+            self.disk_map.switch_values(current_file_indices, new_indices)
 
         return self.disk_map.get_checksum()
@@ -0,0 +1,44 @@
+import numpy as np
+
+from utilities.input_generator import get_grid_side, grid_to_text
+
+BASE_SIDE = 45
+# number of hiking trails carved into the map per cell
+TRAIL_DENSITY = 0.1
+STEPS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate height map with scale times as many cells as the real input.
+
+    Hiking trails from 0 to 9 are carved into a map of random heights as random walks,
+    so that later trails cross earlier ones like in the real input.
+    """
+    rng = np.random.default_rng(seed)
+    side = get_grid_side(BASE_SIDE, scale)
+    heights = rng.integers(0, 10, size=(side, side))
+    trail_count = max(1, round(side * side * TRAIL_DENSITY))
+    while trail_count > 0:
+        trail = _get_random_trail(rng, side)
+        if trail is None:
+            continue
+        for height, position in enumerate(trail):
+            heights[position] = height
+        trail_count -= 1
+    return grid_to_text(heights.astype(str))
+
+
+def _get_random_trail(rng: np.random.Generator, side: int) -> list[tuple[int, int]] | None:
+    """Return self-avoiding random walk of ten positions, or None if the walk got stuck."""
+    trail = [(int(rng.integers(side)), int(rng.integers(side)))]
+    while len(trail) < 10:
+        i, j = trail[-1]
+        candidates = [
+            (i + di, j + dj)
+            for di, dj in STEPS
+            if 0 <= i + di < side and 0 <= j + dj < side and (i + di, j + dj) not in trail
+        ]
+        if not candidates:
+            return None
+        trail.append(candidates[rng.integers(len(candidates))])
+    return trail
@@ -6,12 +6,8 @@ class Solution(SolutionAbstract):
     height_map: HeightMap
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        map_l = []
-        for row in self.raw_data:
-            row_l = ["-9" if c == "." else c for c in row]
-            map_l.append([int(c) for c in row_l])
-        self.height_map = HeightMap.create(map_l)
+        """Parse input from self.input_bytes."""
+        self.height_map = HeightMap.create(self.input_bytes)
 
     def part_a(self) -> int:
         """Solve part a."""
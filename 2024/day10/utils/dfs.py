@@ -2,22 +2,22 @@ from copy import deepcopy
 
 import numpy as np
 
-from utilities.types import Index2D
+from utilities.instrumentation import count, hot_path
 
 
 class DepthFirstSearch:
     values: np.ndarray
-    graph: dict[Index2D, list[Index2D]]
+    graph: list[list[int]]
     remember_visited: bool
-    visited: set[Index2D]
-    path: list[Index2D]
-    splits: dict[Index2D, list[Index2D]]
+    visited: set[int]
+    path: list[int]
+    splits: dict[int, list[int]]
     top_count: int
 
     def __init__(
         self,
         values: np.ndarray,
-        graph: dict[Index2D, list[Index2D]],
+        graph: list[list[int]],
         remember_visited: bool = True,
     ):
         self.values = values
@@ -28,7 +28,8 @@ class DepthFirstSearch:
         self.splits = {}
         self.top_count = 0
 
-    def _main_loop(self, node: Index2D) -> None:
+    @hot_path("dfs")
+    def _main_loop(self, node: int) -> None:
         if self.remember_visited:
             if node in self.visited:
                 return
@@ -47,6 +48,8 @@ class DepthFirstSearch:
         for neighbour in neighbours:
             self._main_loop(node=neighbour)
 
-    def run(self, start: Index2D) -> None:
+    def run(self, start: int) -> None:
         """Run depth first search from the given start."""
+        top_count_before = self.top_count
         self._main_loop(node=start)
+        count("trail_tops", self.top_count - top_count_before)
@@ -2,6 +2,8 @@ from collections import defaultdict
 
 from rich.progress import track
 
+from utilities import instrumentation
+from utilities.instrumentation import count, hot_path
 from utilities.solution_abstract import SolutionAbstract
 
 
@@ -27,6 +29,7 @@ class Solution(SolutionAbstract):
         return sum(current_stone_count.values())
 
 
+@hot_path("blink_stone")
 def _blink_stone(stone: int) -> list[int]:
     """Apply blink to stone."""
     if stone == 0:
@@ -41,8 +44,10 @@ def _blink_stone(stone: int) -> list[int]:
 
 def _get_blinked_stone_count(current_stone_count: dict[int, int]) -> dict[int, int]:
     """Return bucketed collection of stones after one blink."""
+    if instrumentation.is_enabled():
+        count("stones", sum(current_stone_count.values()))
     new_stone_count = defaultdict(int)
-    for stone, count in current_stone_count.items():
+    for stone, stone_count in current_stone_count.items():
         for new_stone in _blink_stone(stone):
-            new_stone_count[new_stone] += count
+            new_stone_count[new_stone] += stone_count
     return new_stone_count
@@ -0,0 +1,23 @@
+import numpy as np
+
+from utilities.input_generator import get_grid_side, grid_to_text
+
+BASE_SIDE = 140
+BLOCK_SIDE = 5
+NOISE_FRACTION = 0.05
+PLANTS = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate garden map with scale times as many cells as the real input.
+
+    Plant regions are made from blocks of the same plant with some plants scattered in between.
+    """
+    rng = np.random.default_rng(seed)
+    side = get_grid_side(BASE_SIDE, scale)
+    block_count = -(-side // BLOCK_SIDE)
+    blocks = rng.choice(PLANTS, size=(block_count, block_count))
+    garden = np.repeat(np.repeat(blocks, BLOCK_SIDE, axis=0), BLOCK_SIDE, axis=1)[:side, :side]
+    is_noise = rng.random((side, side)) < NOISE_FRACTION
+    garden[is_noise] = rng.choice(PLANTS, size=is_noise.sum())
+    return grid_to_text(garden)
@@ -1,5 +1,6 @@
+import numpy as np
+
 from day12.utils.garden_map import GardenMap
-from day12.utils.plant_mask_map import PlantMaskMap
 from utilities.solution_abstract import SolutionAbstract
 
 
@@ -7,23 +8,15 @@ class Solution(SolutionAbstract):
     garden_map: GardenMap
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        self.garden_map = GardenMap.create(self.raw_data)
+        """Parse input from self.input_bytes."""
+        self.garden_map = GardenMap.create(self.input_bytes)
 
     def part_a(self) -> int:
         """Solve part a."""
-        total_fence_price = 0
-        for plant_type in self.garden_map.plants:
-            plant_mask_map = PlantMaskMap.from_garden_map(garden_map=self.garden_map, plant_type=plant_type)
-            for region in plant_mask_map.get_plant_regions().values():
-                total_fence_price += region.get_fence_price()
-        return total_fence_price
+        regions = self.garden_map.get_regions()
+        return int(np.dot(regions.sizes, self.garden_map.get_region_perimeters(regions)))
 
     def part_b(self) -> int:
         """Solve part b."""
-        total_fence_price = 0
-        for plant_type in self.garden_map.plants:
-            plant_mask_map = PlantMaskMap.from_garden_map(garden_map=self.garden_map, plant_type=plant_type)
-            for region in plant_mask_map.get_plant_regions().values():
-                total_fence_price += region.get_bulk_discount_fence_price()
-        return total_fence_price
+        regions = self.garden_map.get_regions()
+        return int(np.dot(regions.sizes, self.garden_map.get_region_side_counts(regions)))
@@ -2,25 +2,53 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from utilities.label_components import ComponentLabels, label_components
 from utilities.map_base import Map2DBase
+from utilities.types import Index2D
+
+# (row, col) steps to the neighbours of a cell, in clockwise order
+STEPS: tuple[Index2D, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
 
 
 @dataclass
 class GardenMap(Map2DBase):
-    plants: set[str]
-
     @classmethod
-    def create(cls, input: list[str]):
-        """Create a GardenMap instance from a list of lists."""
-        map_list = []
-        plants = set()
-        for row in input:
-            row_list = [c for c in row]
-            plants = plants.union(set(row_list))
-            map_list.append(row_list)
-        map_base = Map2DBase.from_list(map_list)
-        return cls(values=map_base.values, plants=plants)
-
-    def get_plant_mask(self, plant_type: str) -> np.ndarray:
-        """Return boolean mask of where the given plant type is planted."""
-        return self.values == plant_type
+    def create(cls, input_data: bytes | memoryview):
+        """Create a GardenMap instance from the raw input, with plants as character codes."""
+        return cls(values=Map2DBase.from_bytes(input_data).values)
+
+    def get_regions(self) -> ComponentLabels:
+        """Return regions of neighbouring cells with the same plant, labelled in a single pass over the map."""
+        return label_components(self.values)
+
+    def get_region_perimeters(self, regions: ComponentLabels) -> np.ndarray:
+        """Return perimeter of each region, which is the number of cell sides facing another region."""
+        perimeters = np.zeros(regions.component_count, dtype=np.int64)
+        for step in STEPS:
+            is_edge = ~self._get_same_region_mask(regions.labels, step)
+            perimeters += np.bincount(regions.labels[is_edge], minlength=regions.component_count)
+        return perimeters
+
+    def get_region_side_counts(self, regions: ComponentLabels) -> np.ndarray:
+        """Return number of sides of each region."""
+        # a polygon has as many sides as corners
+        side_counts = np.zeros(regions.component_count, dtype=np.int64)
+        for step, next_step in zip(STEPS, STEPS[1:] + STEPS[:1]):
+            diagonal_step = (step[0] + next_step[0], step[1] + next_step[1])
+            has_neighbour = self._get_same_region_mask(regions.labels, step)
+            has_next_neighbour = self._get_same_region_mask(regions.labels, next_step)
+            has_diagonal_neighbour = self._get_same_region_mask(regions.labels, diagonal_step)
+            is_outer_corner = ~has_neighbour & ~has_next_neighbour
+            is_inner_corner = has_neighbour & has_next_neighbour & ~has_diagonal_neighbour
+            is_corner = is_outer_corner | is_inner_corner
+            side_counts += np.bincount(regions.labels[is_corner], minlength=regions.component_count)
+        return side_counts
+
+    @staticmethod
+    def _get_same_region_mask(labels: np.ndarray, step: Index2D) -> np.ndarray:
+        """Return boolean mask of the cells whose neighbour one step away is in the same region."""
+        height, width = labels.shape
+        # cells outside of the map are labelled -1, which no region has
+        padded = np.pad(labels, 1, constant_values=-1)
+        neighbour_labels = padded[1 + step[0] : 1 + step[0] + height, 1 + step[1] : 1 + step[1] + width]
+        return neighbour_labels == labels
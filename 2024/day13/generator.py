@@ -0,0 +1,24 @@
+import numpy as np
+
+BASE_MACHINE_COUNT = 320
+MAX_BUTTON_PRESS_COUNT = 100
+
+
+def generate_input(scale: float, seed: int = 0) -> str:
+    """Generate input with scale times as many claw machines as the real input."""
+    rng = np.random.default_rng(seed)
+    machine_count = max(1, round(BASE_MACHINE_COUNT * scale))
+    machines = []
+    while len(machines) < machine_count:
+        a_x, a_y, b_x, b_y = (int(x) for x in rng.integers(10, 100, size=4))
+        if a_x * b_y == a_y * b_x:
+            # buttons moving in the same direction are not part of the puzzle
+            continue
+        a_count, b_count = (int(x) for x in rng.integers(0, MAX_BUTTON_PRESS_COUNT + 1, size=2))
+        prize_x = a_count * a_x + b_count * b_x
+        prize_y = a_count * a_y + b_count * b_y
+        if rng.random() < 0.5:
+            # most likely unsolvable
+            prize_x += 1
+        machines.append(f"Button A: X+{a_x}, Y+{a_y}\nButton B: X+{b_x}, Y+{b_y}\nPrize: X={prize_x}, Y={prize_y}\n")
+    return "\n".join(machines)
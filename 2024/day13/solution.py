@@ -1,5 +1,4 @@
 import re
-from itertools import groupby
 
 from day13.utils.claw_machine import ButtonA, ButtonB, ClawMachine, XYPosition
 from utilities.solution_abstract import SolutionAbstract
@@ -18,12 +17,10 @@ class Solution(SolutionAbstract):
         return numbers
 
     def _parse_input(self):
-        """Parse input from self.raw_data."""
-        machine_data_list = [list(g) for is_machine_data, g in groupby(self.raw_data, key=bool) if is_machine_data]
-
+        """Parse input from self.iter_records()."""
         # Create machines for part a:
         self.machines_part_a = []
-        for machine_data in machine_data_list:
+        for machine_data in self.iter_records():
             self.machines_part_a.append(
                 ClawMachine(
                     a_button=ButtonA(*self._to_int_tuple(machine_data[0])),
@@ -1,15 +1,37 @@
+import sys
+
 import typer
+from typing_extensions import Annotated
+
+from cli.utils.lazy_group import LazyTyperGroup
+
+
+class Commands(LazyTyperGroup):
+    lazy_commands = {
+        "solve": "cli.solve",
+        "init": "cli.init",
+        "submit": "cli.submit",
+        "profile": "cli.profile",
+        "bench": "cli.bench",
+        "serve": "cli.serve",
+    }
+
+
+app = typer.Typer(cls=Commands)
+
 
-from cli.init import app as init
-from cli.profile import app as profile
-from cli.solve import app as solver
-from cli.submit import app as submit
+@app.callback()
+def main(
+    import_timing: Annotated[
+        bool, typer.Option("--import-timing", help="report '-X importtime' numbers for the command")
+    ] = False,
+):
+    """Advent of Code CLI."""
+    if import_timing:
+        from cli.utils.import_timing import run_with_import_timing
 
-app = typer.Typer()
-app.add_typer(solver)
-app.add_typer(init)
-app.add_typer(submit)
-app.add_typer(profile)
+        argv = [arg for arg in sys.argv if arg != "--import-timing"]
+        raise typer.Exit(run_with_import_timing(argv))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from utilities.rolling_window import count_kernel_matches, count_line_matches, find_kernel_matches
+
+
+def _to_codes(rows: list[str]) -> np.ndarray:
+    """Return 2D array of the character codes of rows of equal length."""
+    return np.frombuffer("".join(rows).encode(), dtype=np.uint8).reshape(len(rows), -1)
+
+
+class CountLineMatchesTest(unittest.TestCase):
+    def test_single_row_grid(self):
+        grid = _to_codes(["XMASAMX"])
+        self.assertEqual(count_line_matches(grid, _to_codes(["XMAS", "SAMX"])), 2)
+
+    def test_single_column_grid(self):
+        grid = _to_codes(list("XMASAMX"))
+        self.assertEqual(count_line_matches(grid, _to_codes(["XMAS", "SAMX"])), 2)
+
+    def test_grid_smaller_than_pattern(self):
+        self.assertEqual(count_line_matches(_to_codes(["XM", "AS"]), _to_codes(["XMAS"])), 0)
+
+    def test_single_cell_pattern_is_counted_once(self):
+        self.assertEqual(count_line_matches(_to_codes(["XX", "MX"]), _to_codes(["X"])), 3)
+
+    def test_all_directions(self):
+        grid = _to_codes(["XMAS", "MMXA", "AXAX", "SXXS"])
+        # the row, the column and the diagonal from the top left corner
+        self.assertEqual(count_line_matches(grid, _to_codes(["XMAS"])), 3)
+
+
+class KernelMatchesTest(unittest.TestCase):
+    def test_grid_smaller_than_kernel(self):
+        grid = _to_codes(["XMASAMX"])
+        kernel = _to_codes(["M.S", ".A.", "M.S"])
+        self.assertEqual(count_kernel_matches(grid, kernel, masks=kernel != ord(".")), 0)
+        self.assertEqual(find_kernel_matches(grid, kernel).shape, (0, 2))
+
+    def test_masked_kernel(self):
+        grid = _to_codes(["MXS", "XAX", "MXS"])
+        kernel = _to_codes(["M.S", ".A.", "M.S"])
+        self.assertEqual(find_kernel_matches(grid, kernel, masks=kernel != ord(".")).tolist(), [[0, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from typing import Callable, NamedTuple, Self
+
+import numpy as np
+
+type EdgePredicate = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+# (row, col) steps ordered so that the neighbours of each cell come out sorted by flat index
+STEPS_4 = ((-1, 0), (0, -1), (0, 1), (1, 0))
+STEPS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class Adjacency(NamedTuple):
+    """Adjacency of grid cells in compressed sparse row format, over flat indices row * width + col.
+
+    The neighbours of cell i are neighbours[offsets[i] : offsets[i + 1]].
+    """
+
+    offsets: np.ndarray
+    neighbours: np.ndarray
+
+    @classmethod
+    def from_grid(cls, values: np.ndarray, connectivity: int = 4, predicate: EdgePredicate | None = None) -> Self:
+        """Create Adjacency of the cells of a 2D grid.
+
+        predicate is called once with the values at the source and target cells of all edges in one direction
+        and returns a boolean mask of the edges to keep.
+        """
+        if connectivity == 4:
+            steps = STEPS_4
+        elif connectivity == 8:
+            steps = STEPS_8
+        else:
+            raise ValueError(f"connectivity must be 4 or 8, not {connectivity}")
+        height, width = values.shape
+        flat_indices = np.arange(height * width).reshape(height, width)
+
+        is_edge = np.zeros((height, width, len(steps)), dtype=bool)
+        targets = np.zeros((height, width, len(steps)), dtype=np.int64)
+        for k, (d_row, d_col) in enumerate(steps):
+            # slices of the cells whose step in this direction stays inside the grid, and of their targets
+            sources = (slice(max(-d_row, 0), height - max(d_row, 0)), slice(max(-d_col, 0), width - max(d_col, 0)))
+            shifted = (slice(max(d_row, 0), height - max(-d_row, 0)), slice(max(d_col, 0), width - max(-d_col, 0)))
+            is_edge[*sources, k] = True if predicate is None else predicate(values[sources], values[shifted])
+            targets[*sources, k] = flat_indices[shifted]
+
+        is_edge = is_edge.reshape(height * width, len(steps))
+        offsets = np.zeros(height * width + 1, dtype=np.int64)
+        np.cumsum(is_edge.sum(axis=1), out=offsets[1:])
+        # row-major selection keeps the edges grouped by source cell
+        return cls(offsets=offsets, neighbours=targets.reshape(height * width, len(steps))[is_edge])
+
+    @property
+    def node_count(self) -> int:
+        """Return number of cells."""
+        return len(self.offsets) - 1
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Return number of neighbours of each cell."""
+        return np.diff(self.offsets)
+
+    def get_neighbours(self, index: int) -> np.ndarray:
+        """Return flat indices of the neighbours of a cell."""
+        return self.neighbours[self.offsets[index] : self.offsets[index + 1]]
+
+    def get_sources(self) -> np.ndarray:
+        """Return source cell of each entry in neighbours."""
+        return np.repeat(np.arange(self.node_count), self.degrees)
+
+    def to_lists(self) -> list[list[int]]:
+        """Return neighbours of each cell as lists, which are faster than arrays to walk one cell at a time."""
+        neighbours = self.neighbours.tolist()
+        offsets = self.offsets.tolist()
+        return [neighbours[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
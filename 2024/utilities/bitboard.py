@@ -0,0 +1,113 @@
+from functools import lru_cache
+from typing import NamedTuple, Self
+
+import numpy as np
+
+
+class Bitboard(NamedTuple):
+    """Boolean grid packed into the bits of a single integer.
+
+    The cell (row, col) is bit row * (width + 1) + col. The extra bit at the end of each row is always zero
+    and separates the rows, so set operations work on all cells of the board at once.
+    """
+
+    bits: int
+    shape: tuple[int, int]
+
+    @classmethod
+    def empty(cls, shape: tuple[int, int]) -> Self:
+        """Create Bitboard without any set cells."""
+        return cls(bits=0, shape=shape)
+
+    @classmethod
+    def full(cls, shape: tuple[int, int]) -> Self:
+        """Create Bitboard with all cells set."""
+        return cls(bits=_get_valid_bits(shape), shape=shape)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> Self:
+        """Create Bitboard from a 2D boolean array."""
+        height, width = mask.shape
+        padded = np.zeros((height, width + 1), dtype=bool)
+        padded[:, :width] = mask
+        return cls(bits=_pack_bits(padded), shape=(height, width))
+
+    @classmethod
+    def from_indices(cls, indices: np.ndarray, shape: tuple[int, int]) -> Self:
+        """Create Bitboard with the cells at an Nx2 array of positions set."""
+        indices = np.asarray(indices).reshape(-1, 2)
+        if ((indices < 0) | (indices >= np.array(shape))).any():
+            raise IndexError(f"positions are outside of shape {shape}")
+        # scatter into the padded cells and pack them at once, setting bits one by one copies the integer each time
+        is_set = np.zeros(shape[0] * (shape[1] + 1), dtype=bool)
+        is_set[indices[:, 0] * (shape[1] + 1) + indices[:, 1]] = True
+        return cls(bits=_pack_bits(is_set), shape=shape)
+
+    def to_mask(self) -> np.ndarray:
+        """Return 2D boolean array of the set cells."""
+        height, width = self.shape
+        bit_count = height * (width + 1)
+        packed = np.frombuffer(self.bits.to_bytes((bit_count + 7) // 8, "little"), dtype=np.uint8)
+        padded = np.unpackbits(packed, count=bit_count, bitorder="little").reshape(height, width + 1)
+        return padded[:, :width].astype(bool)
+
+    @property
+    def height(self) -> int:
+        """Return number of rows."""
+        return self.shape[0]
+
+    @property
+    def width(self) -> int:
+        """Return number of columns."""
+        return self.shape[1]
+
+    def is_set(self, row: int, col: int) -> bool:
+        """Return True if the cell is set."""
+        return bool(self.bits >> self._get_bit_index(row, col) & 1)
+
+    def set(self, row: int, col: int) -> Self:
+        """Return Bitboard with the cell set as well."""
+        return self._replace(bits=self.bits | 1 << self._get_bit_index(row, col))
+
+    def popcount(self) -> int:
+        """Return number of set cells."""
+        return self.bits.bit_count()
+
+    def __and__(self, other: Self) -> Self:
+        return self._replace(bits=self.bits & self._get_other_bits(other))
+
+    def __or__(self, other: Self) -> Self:
+        return self._replace(bits=self.bits | self._get_other_bits(other))
+
+    def __xor__(self, other: Self) -> Self:
+        return self._replace(bits=self.bits ^ self._get_other_bits(other))
+
+    def __invert__(self) -> Self:
+        return self._replace(bits=~self.bits & _get_valid_bits(self.shape))
+
+    def _get_bit_index(self, row: int, col: int) -> int:
+        """Return index of the bit of a cell."""
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"cell ({row}, {col}) is outside of shape {self.shape}")
+        return int(row) * (self.width + 1) + int(col)
+
+    def _get_other_bits(self, other: Self) -> int:
+        """Return bits of other, checking that it has the same shape."""
+        if other.shape != self.shape:
+            raise ValueError(f"shapes {self.shape} and {other.shape} do not match")
+        return other.bits
+
+
+@lru_cache
+def _get_valid_bits(shape: tuple[int, int]) -> int:
+    """Return bits of all cells of a Bitboard of the given shape, without the padding bit of each row."""
+    height, width = shape
+    row_bits = (1 << width) - 1
+    # repeat the row pattern height times by multiplying with a number that has one bit at each row start
+    row_starts = _pack_bits(np.arange(height * (width + 1)) % (width + 1) == 0)
+    return row_bits * row_starts
+
+
+def _pack_bits(is_set: np.ndarray) -> int:
+    """Return integer with bit i set where the flattened boolean array is True."""
+    return int.from_bytes(np.packbits(is_set, axis=None, bitorder="little").tobytes(), "little")
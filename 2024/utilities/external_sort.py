@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 2**20
+
+
+def write_sorted_run(values: np.ndarray, run_path: Path) -> Path:
+    """Sort 1D values and write them to run_path, returning the path."""
+    np.save(run_path, np.sort(values))
+    return run_path
+
+
+def merge_sorted_runs(run_paths: list[Path], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+    """Yield the values of sorted run files in sorted order, in blocks.
+
+    Each round reads the next block of every run and emits all values up to the smallest last value of the
+    blocks that do not reach the end of their run. Values after that in any run are at least as large, so
+    the emitted values can be sorted on their own, and every round emits at least one whole block.
+    """
+    runs = [np.load(run_path, mmap_mode="r") for run_path in run_paths]
+    positions = [0] * len(runs)
+    while True:
+        blocks = [np.asarray(run[position : position + block_size]) for run, position in zip(runs, positions)]
+        if not any(block.size for block in blocks):
+            return
+        bounds = [
+            block[-1] for block, run, position in zip(blocks, runs, positions) if position + block.size < run.size
+        ]
+        if bounds:
+            threshold = min(bounds)
+            counts = [int(np.searchsorted(block, threshold, side="right")) for block in blocks]
+        else:
+            counts = [block.size for block in blocks]
+        positions = [position + count for position, count in zip(positions, counts)]
+        yield np.sort(np.concatenate([block[:count] for block, count in zip(blocks, counts)]))
+
+
+def iter_value_counts(sorted_blocks: Iterable[np.ndarray]) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield unique values and their counts from blocks of sorted values.
+
+    Values are strictly increasing across yields, since the last value of a block is held back until it is
+    known that the next block does not continue it.
+    """
+    carry_value = None
+    carry_count = 0
+    for block in sorted_blocks:
+        if block.size == 0:
+            continue
+        values, counts = np.unique(block, return_counts=True)
+        if carry_value is not None:
+            if values[0] == carry_value:
+                counts[0] += carry_count
+            else:
+                yield np.array([carry_value]), np.array([carry_count])
+        carry_value, carry_count = values[-1], counts[-1]
+        if values.size > 1:
+            yield values[:-1], counts[:-1]
+    if carry_value is not None:
+        yield np.array([carry_value]), np.array([carry_count])
@@ -0,0 +1,13 @@
+import math
+
+import numpy as np
+
+
+def get_grid_side(base_side: int, scale: float) -> int:
+    """Return side of a square grid with scale times as many cells as a base_side x base_side grid."""
+    return max(1, round(base_side * math.sqrt(scale)))
+
+
+def grid_to_text(grid: np.ndarray) -> str:
+    """Convert 2D array of single characters to input text."""
+    return "".join("".join(row) + "\n" for row in grid)
@@ -0,0 +1,146 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# hot_path and count are bound to no-op stand-ins while instrumentation is disabled, and modules bind
+# them when importing them, so enable() has to be called before importing the solution modules to
+# instrument
+_is_enabled = False
+_recorder: "Recorder | None" = None
+
+
+@dataclass
+class SectionStats:
+    call_count: int = 0
+    time: float = 0.0
+    # recursive calls are counted, but only the outermost call is timed to avoid counting time twice
+    depth: int = 0
+
+
+@dataclass
+class Recorder:
+    """Call counts and cumulative times of hot path sections, along with counters."""
+
+    sections: defaultdict[str, SectionStats] = field(default_factory=lambda: defaultdict(SectionStats))
+    counters: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def enable() -> None:
+    """Instrument hot paths and counters imported from now on."""
+    global _is_enabled, hot_path, count
+    _is_enabled = True
+    hot_path, count = _HotPath, _count
+
+
+def disable() -> None:
+    """Stop instrumenting hot paths and counters imported from now on and stop collecting."""
+    global _is_enabled, _recorder, hot_path, count
+    _is_enabled = False
+    _recorder = None
+    hot_path, count = _DisabledHotPath, _ignore_count
+
+
+def is_enabled() -> bool:
+    """Return whether hot paths defined now are instrumented."""
+    return _is_enabled
+
+
+@contextmanager
+def collect() -> Iterator[Recorder]:
+    """Collect hot path sections and counters while the context is active."""
+    global _recorder
+    recorder = Recorder()
+    _recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _recorder = None
+
+
+class _HotPath:
+    """Record call count and cumulative time of a section, as decorator or context manager."""
+
+    name: str
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, func: F) -> F:
+        name = self.name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            stats = _recorder.sections[name]
+            stats.call_count += 1
+            stats.depth += 1
+            start = perf_counter() if stats.depth == 1 else None
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.depth -= 1
+                if start is not None:
+                    stats.time += perf_counter() - start
+
+        return wrapper  # type: ignore[return-value]
+
+    def __enter__(self) -> None:
+        if _recorder is None:
+            return
+        stats = _recorder.sections[self.name]
+        stats.call_count += 1
+        stats.depth += 1
+        if stats.depth == 1:
+            stats.time -= perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        if _recorder is None:
+            return
+        stats = _recorder.sections[self.name]
+        stats.depth -= 1
+        if stats.depth == 0:
+            stats.time += perf_counter()
+
+
+class _DisabledHotPath:
+    """Stand-in for _HotPath while instrumentation is disabled, doing nothing as decorator or context manager.
+
+    The decorator returns the function unchanged, so decorated functions cost nothing outside of profiling.
+    The context manager still costs an object and two method calls per use, about 0.5 us, so keep it out
+    of inner loops.
+    """
+
+    def __init__(self, name: str):
+        pass
+
+    def __call__(self, func: F) -> F:
+        return func
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+def _count(name: str, n: int = 1) -> None:
+    """Add n to the named counter while collecting."""
+    if _recorder is not None:
+        _recorder.counters[name] += n
+
+
+def _ignore_count(name: str, n: int = 1) -> None:
+    """Stand-in for _count while instrumentation is disabled.
+
+    Each call still costs about 30 ns, so count totals once outside of inner loops instead of every item.
+    """
+
+
+hot_path: type[_HotPath] | type[_DisabledHotPath] = _DisabledHotPath
+count: Callable[..., None] = _ignore_count
@@ -0,0 +1,116 @@
+from typing import NamedTuple
+
+import numpy as np
+
+# (row, col) steps to the later neighbours of a cell, apart from the one to the right which is handled by runs
+FORWARD_STEPS_4 = ((1, 0),)
+FORWARD_STEPS_8 = ((1, -1), (1, 0), (1, 1))
+
+
+class ComponentLabels(NamedTuple):
+    """Connected components of a grid.
+
+    labels holds the component of each cell, or -1 for cells outside the mask. Components are numbered in
+    order of their first cell in row-major order. bounding_boxes holds min_row, min_col, max_row and max_col
+    of each component, all inclusive.
+    """
+
+    labels: np.ndarray
+    sizes: np.ndarray
+    bounding_boxes: np.ndarray
+
+    @property
+    def component_count(self) -> int:
+        """Return number of components."""
+        return len(self.sizes)
+
+    def get_component_indices(self) -> list[np.ndarray]:
+        """Return flat indices of the cells of each component."""
+        if self.sizes.size == 0:
+            return []
+        flat_labels = self.labels.ravel()
+        order = np.argsort(flat_labels, kind="stable")
+        # masked cells are labelled -1 and sort first
+        order = order[flat_labels.size - int(self.sizes.sum()) :]
+        return np.split(order, np.cumsum(self.sizes)[:-1])
+
+
+def label_components(values: np.ndarray, mask: np.ndarray | None = None, connectivity: int = 4) -> ComponentLabels:
+    """Label the connected components of neighbouring cells with equal values inside mask.
+
+    Cells are first joined into horizontal runs, then the runs are merged by union-find over the remaining
+    edges. Each round hooks the larger root of every edge onto the smaller one and compresses all paths,
+    so all operations are on whole arrays and the number of rounds grows only logarithmically in practice.
+    """
+    if connectivity == 4:
+        forward_steps = FORWARD_STEPS_4
+    elif connectivity == 8:
+        forward_steps = FORWARD_STEPS_8
+    else:
+        raise ValueError(f"connectivity must be 4 or 8, not {connectivity}")
+    height, width = values.shape
+    cell_count = height * width
+    dtype = np.int32 if cell_count < 2**31 else np.int64
+    if mask is None:
+        mask = np.ones(values.shape, dtype=bool)
+    flat_indices = np.arange(cell_count, dtype=dtype).reshape(height, width)
+
+    # every cell points to the first cell of its horizontal run, which is a valid union-find forest
+    continues_run = np.zeros(values.shape, dtype=bool)
+    continues_run[:, 1:] = (values[:, 1:] == values[:, :-1]) & mask[:, 1:] & mask[:, :-1]
+    parent = np.maximum.accumulate(np.where(continues_run, 0, flat_indices).ravel())
+
+    sources = []
+    targets = []
+    for d_row, d_col in forward_steps:
+        source_slice = (slice(0, height - d_row), slice(max(-d_col, 0), width - max(d_col, 0)))
+        target_slice = (slice(d_row, height), slice(max(d_col, 0), width - max(-d_col, 0)))
+        is_edge = (values[source_slice] == values[target_slice]) & mask[source_slice] & mask[target_slice]
+        sources.append(flat_indices[source_slice][is_edge])
+        targets.append(flat_indices[target_slice][is_edge])
+    source_roots = parent[np.concatenate(sources)]
+    target_roots = parent[np.concatenate(targets)]
+
+    while True:
+        is_cross = source_roots != target_roots
+        if not is_cross.any():
+            break
+        lower = np.minimum(source_roots[is_cross], target_roots[is_cross])
+        upper = np.maximum(source_roots[is_cross], target_roots[is_cross])
+        np.minimum.at(parent, upper, lower)
+        parent = _compress(parent)
+        source_roots = parent[lower]
+        target_roots = parent[upper]
+
+    # roots always point to the smallest index, so the root is the first cell of its component
+    flat_mask = mask.ravel()
+    is_root = (parent == flat_indices.ravel()) & flat_mask
+    root_labels = np.cumsum(is_root, dtype=dtype) - 1
+    labels = np.where(flat_mask, root_labels[parent], -1)
+
+    masked_labels = labels[flat_mask]
+    rows, cols = np.divmod(flat_indices.ravel()[flat_mask], width)
+    roots = np.flatnonzero(is_root)
+    component_count = len(roots)
+    bounding_boxes = np.empty((component_count, 4), dtype=dtype)
+    bounding_boxes[:, 0] = roots // width
+    bounding_boxes[:, 1] = width
+    bounding_boxes[:, 2] = 0
+    bounding_boxes[:, 3] = 0
+    np.minimum.at(bounding_boxes[:, 1], masked_labels, cols)
+    np.maximum.at(bounding_boxes[:, 2], masked_labels, rows)
+    np.maximum.at(bounding_boxes[:, 3], masked_labels, cols)
+    return ComponentLabels(
+        labels=labels.reshape(height, width),
+        sizes=np.bincount(masked_labels, minlength=component_count),
+        bounding_boxes=bounding_boxes,
+    )
+
+
+def _compress(parent: np.ndarray) -> np.ndarray:
+    """Return parent with every index pointing directly to its root."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
@@ -3,6 +3,7 @@ from typing import Any
 
 import numpy as np
 
+from utilities.adjacency import Adjacency, EdgePredicate
 from utilities.types import Index2D
 
 
@@ -10,12 +11,42 @@ from utilities.types import Index2D
 class Map2DBase:
     values: np.ndarray
     _map_size: tuple[int, int] = field(init=False)
+    _adjacency_cache: dict[tuple[int, EdgePredicate | None], Adjacency] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
 
     @classmethod
     def from_list(cls, map_list: list[list[Any]], dtype: np.dtype = np.dtype("U1")):
         """Create a MapBase instance from a list of lists."""
         return cls(values=np.array(map_list, dtype=dtype))
 
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview):
+        """Create a MapBase instance with the uint8 character codes of a grid of text lines.
+
+        Lines may end with "\\n" or "\\r\\n", and the last line ending is optional.
+        """
+        array = np.frombuffer(data, dtype=np.uint8)
+        if array.size == 0:
+            return cls(values=np.zeros((0, 0), dtype=np.uint8))
+        line_endings = np.flatnonzero(array == ord("\n"))
+        line_length = int(line_endings[0]) + 1 if line_endings.size else array.size + 1
+        width = line_length - 1
+        if line_endings.size and width > 0 and array[width - 1] == ord("\r"):
+            width -= 1
+        height = -(-array.size // line_length)
+        if not np.array_equal(line_endings, np.arange(line_length - 1, array.size, line_length)):
+            raise ValueError("lines of the map have different lengths")
+        missing_size = height * line_length - array.size
+        if missing_size == line_length - width:
+            # the last line has no line ending, add one so that all lines have the same length
+            array = np.concatenate((array, np.frombuffer(b"\r\n"[-missing_size:], dtype=np.uint8)))
+        elif missing_size != 0:
+            raise ValueError("lines of the map have different lengths")
+        # view the lines without their endings, then copy into a compact array
+        values = array.reshape(height, line_length)[:, :width]
+        return cls(values=values.copy())
+
     def __post_init__(self) -> None:
         """Set remaining attributes."""
         self._map_size = self.values.shape
@@ -53,6 +84,28 @@ class Map2DBase:
         return {
             (max(row - 1, 0), col),
             (row, max(col - 1, 0)),
-            (min(row + 1, self.width - 1), col),
-            (row, min(col + 1, self.height - 1)),
+            (min(row + 1, self.height - 1), col),
+            (row, min(col + 1, self.width - 1)),
         }.difference({(row, col)})
+
+    def get_flat_index(self, row: int, col: int) -> int:
+        """Return index of the position in the flattened map."""
+        return row * self.width + col
+
+    def get_position(self, flat_index: int) -> Index2D:
+        """Return position of an index in the flattened map."""
+        row, col = divmod(flat_index, self.width)
+        return row, col
+
+    def get_adjacency(self, connectivity: int = 4, predicate: EdgePredicate | None = None) -> Adjacency:
+        """Return adjacency of the cells over flat indices, keeping only edges for which predicate holds.
+
+        The adjacency is cached per connectivity and predicate, so pass the same predicate function to reuse it.
+        The cache is not invalidated if values are modified afterwards.
+        """
+        key = (connectivity, predicate)
+        if key not in self._adjacency_cache:
+            self._adjacency_cache[key] = Adjacency.from_grid(
+                self.values, connectivity=connectivity, predicate=predicate
+            )
+        return self._adjacency_cache[key]
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Any
+
+DEFAULT_MAX_CACHE_SIZE = 256 * 2**20  # bytes
+
+
+@dataclass
+class ParseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    saved_time: float = 0.0
+
+    def __add__(self, other: "ParseCacheStats") -> "ParseCacheStats":
+        return ParseCacheStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            saved_time=self.saved_time + other.saved_time,
+        )
+
+
+class ParseCache:
+    """Content-addressed cache for parsed solution state.
+
+    Entries are keyed by the hash of the input bytes and the solution source code, and the
+    least recently used entries are evicted once the cache grows beyond max_size bytes.
+    """
+
+    cache_dir: Path
+    max_size: int
+    stats: ParseCacheStats
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.stats = ParseCacheStats()
+
+    @staticmethod
+    def get_key(input_data: bytes | memoryview, source_dirs: list[Path]) -> str:
+        """Return cache key for the given input data and source code."""
+        digest = hashlib.sha256(input_data)
+        digest.update(hash_source_files(source_dirs).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return cached state for the given key, or None if it is not cached."""
+        entry_path = self._get_entry_path(key)
+        start = timer()
+        try:
+            with entry_path.open("rb") as file:
+                entry = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.stats.misses += 1
+            return None
+        # touch entry so that it is treated as recently used
+        os.utime(entry_path)
+        self.stats.hits += 1
+        self.stats.saved_time += entry["parse_time"] - (timer() - start)
+        return entry["state"]
+
+    def put(self, key: str, state: dict[str, Any], parse_time: float) -> None:
+        """Store parsed state in the cache and evict old entries if needed."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._get_entry_path(key)
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with temp_path.open("wb") as file:
+            pickle.dump({"parse_time": parse_time, "state": state}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(entry_path)
+        self._evict()
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Return path to cache entry."""
+        return self.cache_dir / f"{key}.pickle"
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits within max_size."""
+        entries = sorted(self.cache_dir.glob("*.pickle"), key=lambda path: path.stat().st_mtime)
+        total_size = sum(path.stat().st_size for path in entries)
+        for entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            total_size -= entry_path.stat().st_size
+            entry_path.unlink(missing_ok=True)
+
+
+def hash_source_files(source_dirs: list[Path]) -> str:
+    """Return hash of all python source files in the given directories."""
+    digest = hashlib.sha256()
+    for source_dir in source_dirs:
+        for source_file in sorted(source_dir.rglob("*.py")):
+            digest.update(source_file.read_bytes())
+    return digest.hexdigest()
@@ -1,8 +1,91 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def rolling_window(a: np.ndarray, size: int) -> np.ndarray:
-    """Return a rolling window view into a numpy array."""
-    shape = a.shape[:-1] + (a.shape[-1] - size + 1, size)
-    strides = a.strides + (a.strides[-1],)
-    return np.lib.stride_tricks.as_strided(a, shape=shape, strides=strides)
+    """Return a read-only rolling window view into a numpy array along the last axis."""
+    return sliding_window_view(a, size, axis=-1)
+
+
+def rolling_window_2d(a: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Return a read-only (H - h + 1, W - w + 1, h, w) view of all h x w windows of a 2D array."""
+    return sliding_window_view(a, shape)
+
+
+def diagonal_windows(a: np.ndarray, size: int) -> np.ndarray:
+    """Return a read-only (H - size + 1, W - size + 1, size) view of the diagonal lines going down to the right."""
+    return np.diagonal(rolling_window_2d(a, (size, size)), axis1=-2, axis2=-1)
+
+
+def anti_diagonal_windows(a: np.ndarray, size: int) -> np.ndarray:
+    """Return a read-only (H - size + 1, W - size + 1, size) view of the diagonal lines going down to the left.
+
+    The line at [i, j] starts at the top right corner of the window at [i, j], which is a[i, j + size - 1].
+    """
+    return np.diagonal(rolling_window_2d(a, (size, size))[..., ::-1], axis1=-2, axis2=-1)
+
+
+def count_line_matches(a: np.ndarray, patterns: np.ndarray) -> int:
+    """Return number of places where any of the patterns is found along rows, columns and both diagonals.
+
+    patterns has shape (P, n) and is matched in the given order only, so include reversed patterns to find
+    lines read backwards. Patterns of a single cell are counted once per matching cell, and directions
+    along which the grid is shorter than the patterns have no matches.
+    """
+    patterns = np.atleast_2d(patterns)
+    size = patterns.shape[1]
+    height, width = a.shape
+    line_views = []
+    if width >= size:
+        line_views.append(rolling_window(a, size))
+    # a single cell lies along every direction, so it is only counted along rows
+    if size > 1 and height >= size:
+        line_views.append(rolling_window(a.T, size))
+        if width >= size:
+            line_views.extend((diagonal_windows(a, size), anti_diagonal_windows(a, size)))
+    return sum(int(_match_lines(lines, patterns).sum()) for lines in line_views)
+
+
+def count_kernel_matches(a: np.ndarray, kernels: np.ndarray, masks: np.ndarray | None = None) -> int:
+    """Return number of windows of a 2D array that match any of the kernels."""
+    return int(_match_kernels(a, kernels, masks).sum())
+
+
+def find_kernel_matches(a: np.ndarray, kernels: np.ndarray, masks: np.ndarray | None = None) -> np.ndarray:
+    """Return Nx2 array of the top left corners of the windows that match any of the kernels."""
+    return np.argwhere(_match_kernels(a, kernels, masks))
+
+
+def _match_lines(lines: np.ndarray, patterns: np.ndarray) -> np.ndarray:
+    """Return mask of the lines that match any of the patterns."""
+    is_match = np.zeros(lines.shape[:-1], dtype=bool)
+    for pattern in patterns:
+        # compare one position at a time to avoid allocating a boolean array of the size of all windows
+        is_pattern_match = np.ones(lines.shape[:-1], dtype=bool)
+        for k, value in enumerate(pattern):
+            is_pattern_match &= lines[..., k] == value
+        is_match |= is_pattern_match
+    return is_match
+
+
+def _match_kernels(a: np.ndarray, kernels: np.ndarray, masks: np.ndarray | None) -> np.ndarray:
+    """Return mask of the windows that match any of the kernels.
+
+    kernels has shape (K, h, w) or (h, w), and masks, if given, has the same shape and marks the cells of
+    each kernel that have to match, so that the other cells can hold anything.
+    """
+    kernels = kernels.reshape(-1, *kernels.shape[-2:])
+    masks = np.ones(kernels.shape, dtype=bool) if masks is None else np.broadcast_to(masks, kernels.shape)
+    if a.shape[0] < kernels.shape[1] or a.shape[1] < kernels.shape[2]:
+        # no window of the kernel size fits into the grid
+        return np.zeros(
+            (max(a.shape[0] - kernels.shape[1] + 1, 0), max(a.shape[1] - kernels.shape[2] + 1, 0)), dtype=bool
+        )
+    windows = rolling_window_2d(a, kernels.shape[1:])
+    is_match = np.zeros(windows.shape[:2], dtype=bool)
+    for kernel, mask in zip(kernels, masks):
+        is_kernel_match = np.ones(windows.shape[:2], dtype=bool)
+        for i, j in zip(*np.nonzero(mask)):
+            is_kernel_match &= windows[..., i, j] == kernel[i, j]
+        is_match |= is_kernel_match
+    return is_match
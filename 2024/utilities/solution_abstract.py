@@ -1,21 +1,109 @@
+import inspect
+import mmap
+import pickle
 from abc import ABC, abstractmethod
+from itertools import groupby
 from pathlib import Path
-from typing import Any
+from timeit import default_timer as timer
+from typing import Any, Iterator
+
+import numpy as np
 
 from cli.utils.part import Part
+from utilities.parse_cache import ParseCache
+
+_INPUT_ATTRIBUTES = {"input_file_path", "_input_buffer", "_raw_data"}
 
 
 class SolutionAbstract(ABC):
     """Abstract base class for each day of AoC."""
 
-    raw_data: list[str]
+    input_file_path: Path
+    _input_buffer: mmap.mmap | bytes
+    _raw_data: list[str] | None
 
-    def __init__(self, input_file_path: Path):
+    def __init__(self, input_file_path: Path, parse_cache: ParseCache | None = None):
         if not input_file_path.exists():
             raise ValueError("could not find input file")
-        with input_file_path.open("r") as file:
-            self.raw_data = [line.strip("\r\n") for line in file.readlines()]
+        self.input_file_path = input_file_path
+        self._input_buffer = _map_file(input_file_path)
+        self._raw_data = None
+        if parse_cache is None:
+            self._parse_input()
+        else:
+            self._parse_input_with_cache(parse_cache, self.input_bytes)
+        # the line list is only needed while parsing, so drop it instead of keeping a copy of the input alive
+        self._raw_data = None
+
+    @property
+    def input_bytes(self) -> memoryview:
+        """Return zero-copy view of the input file contents."""
+        return memoryview(self._input_buffer)
+
+    @property
+    def input_array(self) -> np.ndarray:
+        """Return zero-copy, read-only uint8 array of the input file contents."""
+        return np.frombuffer(self._input_buffer, dtype=np.uint8)
+
+    @property
+    def raw_data(self) -> list[str]:
+        """Return input as a list of lines without line endings.
+
+        The list is built on first access.
+        """
+        if self._raw_data is None:
+            text = str(self._input_buffer, "utf-8")
+            if text == "":
+                self._raw_data = []
+            else:
+                self._raw_data = [line.strip("\r") for line in text.removesuffix("\n").split("\n")]
+        return self._raw_data
+
+    @classmethod
+    def get_source_dirs(cls) -> list[Path]:
+        """Return directories with the source code the solution depends on."""
+        return [Path(inspect.getfile(cls)).parent, Path(__file__).parent]
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield input lines without line endings.
+
+        The file is read in buffered chunks and no lines are retained, so memory use does not grow with the input
+        size as long as the caller does not keep the lines either.
+        """
+        with self.input_file_path.open("r", encoding="utf-8", newline="") as file:
+            for line in file:
+                yield line.removesuffix("\n").strip("\r")
+
+    def iter_records(self) -> Iterator[list[str]]:
+        """Yield groups of consecutive non-empty lines, separated by blank lines in the input."""
+        for is_record, lines in groupby(self.iter_lines(), key=bool):
+            if is_record:
+                yield list(lines)
+
+    def _parse_input_with_cache(self, parse_cache: ParseCache, input_data: memoryview) -> None:
+        """Restore parsed state from the cache, or parse input and store the result in the cache."""
+        key = parse_cache.get_key(input_data, self.get_source_dirs())
+        state = parse_cache.get(key)
+        if state is not None:
+            self.__dict__.update(state)
+            return
+
+        start = timer()
         self._parse_input()
+        parse_time = timer() - start
+        parse_cache.put(key, self._get_parsed_state(), parse_time)
+
+    def _get_parsed_state(self) -> dict[str, Any]:
+        """Return attributes set by _parse_input."""
+        return {k: v for k, v in vars(self).items() if k not in _INPUT_ATTRIBUTES}
+
+    def take_snapshot(self) -> bytes:
+        """Return snapshot of the parsed state."""
+        return pickle.dumps(self._get_parsed_state(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_snapshot(self, snapshot: bytes) -> None:
+        """Restore parsed state from a snapshot, undoing any changes made by solving."""
+        self.__dict__.update(pickle.loads(snapshot))
 
     @abstractmethod
     def _parse_input(self) -> Any:
@@ -35,3 +123,13 @@ class SolutionAbstract(ABC):
             return self.part_a()
         else:
             return self.part_b()
+
+
+def _map_file(file_path: Path) -> mmap.mmap | bytes:
+    """Memory-map file for reading."""
+    with file_path.open("rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be memory-mapped
+            return b""